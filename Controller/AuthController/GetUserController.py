@@ -1,30 +1,37 @@
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
-
-# Handle imports for both package and direct execution
-try:
-    from Database.core import DBSession
-    from Models.ResponseModel import UserResponseModel
-    from Models.UserModel import UserRequestModel
-    from Services.AuthUserService.GetUser import GetUser
-    from utils.exceptions import BaseAppException, handle_app_exception
-    from utils.logger import get_logger
-except ImportError:
-    # Fallback to relative imports when used as a package
-    from ...Database.core import DBSession
-    from ...Models.ResponseModel import UserResponseModel
-    from ...Models.UserModel import UserRequestModel
-    from ...Services.AuthUserService.GetUser import GetUser
-    from ...utils.exceptions import BaseAppException, handle_app_exception
-    from ...utils.logger import get_logger
+import re
+from dataclasses import dataclass
+
+from fastapi import HTTPException, status
+from fastapi.responses import ORJSONResponse, Response
+
+from Controller.AuthController import auth_router
+from Database.core import DBSession
+from Services.AuthUserService.GetUser import GetUser
+from utils.logger import get_logger
+from utils.RedisCache import cache_get, cache_set
 
 logger = get_logger()
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+# Fixed response shape; orjson serializes slotted dataclasses natively and
+# faster than an ad-hoc dict built per request
+@dataclass(slots=True)
+class _UserResponse:
+    message: str
+    user: dict
+
+
+# Cheap pre-compiled check for query-param emails; the stricter EmailStr
+# validation is reserved for POST bodies where Pydantic runs anyway
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
+_INVALID_EMAIL_DETAIL = {
+    "error": "ValidationError",
+    "message": "Invalid email address",
+}
 
-@router.get("/get-user", status_code=status.HTTP_200_OK)
-def getUser(email: str, db: DBSession):
+
+@auth_router.get("/get-user", status_code=status.HTTP_200_OK)
+async def getUser(email: str, db: DBSession):
     """Get user information by email.
 
     Args:
@@ -37,45 +44,40 @@ def getUser(email: str, db: DBSession):
     Raises:
         HTTPException: If user retrieval fails
     """
-    logger.info(f"Received get user request for email: {email}")
-
-    try:
-        # Create UserRequestModel from email
-        user_request = UserRequestModel(email=email)
+    logger.info("Received get user request for email: %s", email)
 
-        # Get user from database
-        user = GetUser(db, user_request)
+    if not _EMAIL_RE.match(email):
+        logger.warning("Invalid email supplied to get-user: %s", email)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_INVALID_EMAIL_DETAIL,
+        )
 
-        logger.info(f"User successfully retrieved with ID: {user.id}")
+    # Normalize once; services and cache keys rely on lowercase emails
+    email = email.lower()
 
-        # Convert to response model (convert UUID to string)
-        user_response = UserResponseModel(
-            id=str(user.id),
-            email=user.email,
-        )
+    # Serve from the lookaside cache when possible (skips DB + serialization)
+    cache_key = f"user:{email}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        logger.debug("Cache hit for user email: %s", email)
+        return Response(content=cached, media_type="application/json")
 
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            content={
-                "message": "User retrieved successfully",
-                "user": user_response.model_dump(mode="json"),
-            },
-        )
+    # Get user from database
+    user = await GetUser(db, email)
 
-    except BaseAppException as e:
-        logger.warning(f"Application exception during user retrieval: {e.message}")
-        http_exception = handle_app_exception(e)
-        raise http_exception
+    logger.info("User successfully retrieved with ID: %s", user.id)
 
-    except Exception as e:
-        logger.error(
-            f"Unexpected error during user retrieval for email {email}: {str(e)}",
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "InternalServerError",
-                "message": "An unexpected error occurred while retrieving the user.",
+    # orjson serializes uuid.UUID natively, so pass the id through as-is
+    response = ORJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=_UserResponse(
+            message="User retrieved successfully",
+            user={
+                "id": user.id,
+                "email": user.email,
             },
-        ) from e
+        ),
+    )
+    await cache_set(cache_key, response.body)
+    return response
@@ -1,28 +1,27 @@
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
+from dataclasses import dataclass
 
-# Handle imports for both package and direct execution
-try:
-    from Database.core import DBSession
-    from Models.UserModel import UserRequestModel
-    from Services.AuthUserService.SignUpUser import Signup
-    from utils.exceptions import BaseAppException, handle_app_exception
-    from utils.logger import get_logger
-except ImportError:
-    # Fallback to relative imports when used as a package
-    from ...Database.core import DBSession
-    from ...Models.UserModel import UserRequestModel
-    from ...Services.AuthUserService.SignUpUser import Signup
-    from ...utils.exceptions import BaseAppException, handle_app_exception
-    from ...utils.logger import get_logger
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+
+from Controller.AuthController import auth_router
+from Database.core import DBSession
+from Models.UserModel import UserRequestModel
+from Services.AuthUserService.SignUpUser import Signup
+from utils.logger import get_logger
+from utils.RedisCache import cache_delete
 
 logger = get_logger()
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+# Fixed response shape; orjson serializes slotted dataclasses natively
+@dataclass(slots=True)
+class _SignupResponse:
+    message: str
+    user: dict
+
 
 
-@router.post("/AddUser", status_code=status.HTTP_201_CREATED)
-def addUser(db: DBSession, user_request: UserRequestModel):
+@auth_router.post("/AddUser", status_code=status.HTTP_201_CREATED)
+async def addUser(db: DBSession, user_request: UserRequestModel):
     """Create a new user account.
 
     Args:
@@ -35,37 +34,22 @@ def addUser(db: DBSession, user_request: UserRequestModel):
     Raises:
         HTTPException: If user creation fails
     """
-    logger.info(f"Received signup request for email: {user_request.email}")
-
-    try:
-        user = Signup(db, user_request)
-        logger.info(f"User successfully created with ID: {user.id}")
-
-        return JSONResponse(
-            status_code=status.HTTP_201_CREATED,
-            content={
-                "message": "User successfully created",
-                "user": {
-                    "id": str(user.id),
-                    "email": user.email,
-                },
-            },
-        )
-
-    except BaseAppException as e:
-        logger.warning(f"Application exception during signup: {e.message}")
-        http_exception = handle_app_exception(e)
-        raise http_exception
-
-    except Exception as e:
-        logger.error(
-            f"Unexpected error during signup for email {user_request.email}: {str(e)}",
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "InternalServerError",
-                "message": "An unexpected error occurred while creating the user.",
+    logger.info("Received signup request for email: %s", user_request.email)
+
+    user = await Signup(db, user_request)
+    logger.info("User successfully created with ID: %s", user.id)
+
+    # Invalidate any stale cached reads for this email
+    await cache_delete(f"user:{user_request.email}")
+
+    return ORJSONResponse(
+        status_code=status.HTTP_201_CREATED,
+        content=_SignupResponse(
+            message="User successfully created",
+            user={
+                # orjson serializes uuid.UUID natively
+                "id": user.id,
+                "email": user.email,
             },
-        ) from e
+        ),
+    )
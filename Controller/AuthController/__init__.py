@@ -1 +1,19 @@
-"""Authentication controller package."""
+"""Authentication controller package.
+
+All authentication endpoints register on a single shared /auth router so
+FastAPI only has one APIRouter per URL namespace to merge at startup.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
+
+auth_router = APIRouter(
+    prefix="/auth",
+    tags=["Authentication"],
+    default_response_class=ORJSONResponse,
+)
+
+# Importing the controller modules registers their routes on auth_router
+from Controller.AuthController import GetUserController  # noqa: E402,F401
+from Controller.AuthController import SingUpController  # noqa: E402,F401
+from Controller.AuthController import deleteUserController  # noqa: E402,F401
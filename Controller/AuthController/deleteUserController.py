@@ -1,28 +1,28 @@
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
+from dataclasses import dataclass
 
-# Handle imports for both package and direct execution
-try:
-    from Database.core import DBSession
-    from Models.UserModel import UserRequestModel
-    from Services.AuthUserService.DeleteUser import Delete
-    from utils.exceptions import BaseAppException, handle_app_exception
-    from utils.logger import get_logger
-except ImportError:
-    # Fallback to relative imports when used as a package
-    from ...Database.core import DBSession
-    from ...Models.UserModel import UserRequestModel
-    from ...Services.AuthUserService.DeleteUser import Delete
-    from ...utils.exceptions import BaseAppException, handle_app_exception
-    from ...utils.logger import get_logger
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+
+from Controller.AuthController import auth_router
+from Database.core import DBSession
+from Models.UserModel import UserRequestModel
+from Services.AuthUserService.DeleteUser import Delete
+from utils.logger import get_logger
+from utils.RedisCache import cache_delete
 
 logger = get_logger()
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+# Fixed response shape; orjson serializes slotted dataclasses natively
+@dataclass(slots=True)
+class _DeleteResponse:
+    message: str
+    deleted_email: str
+    deleted_user_id: str
+
 
 
-@router.delete("/RemoveUser", status_code=status.HTTP_200_OK)
-def deleteUser(db: DBSession, user_request: UserRequestModel):
+@auth_router.delete("/RemoveUser", status_code=status.HTTP_200_OK)
+async def deleteUser(db: DBSession, user_request: UserRequestModel):
     """Delete a user account by email.
 
     Args:
@@ -35,31 +35,18 @@ def deleteUser(db: DBSession, user_request: UserRequestModel):
     Raises:
         HTTPException: If user deletion fails
     """
-    logger.info(f"Received delete request for email: {user_request.email}")
-
-    try:
-        result = Delete(db, user_request)
-        logger.info(f"User successfully deleted: {result.get('deleted_email')}")
+    logger.info("Received delete request for email: %s", user_request.email)
 
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            content=result,
-        )
+    result = await Delete(db, user_request)
+    logger.info("User successfully deleted: %s", result.get("deleted_email"))
 
-    except BaseAppException as e:
-        logger.warning(f"Application exception during user deletion: {e.message}")
-        http_exception = handle_app_exception(e)
-        raise http_exception
+    # Invalidate cached reads for this email
+    await cache_delete(
+        f"user:{user_request.email}",
+        f"resume_details:{user_request.email}",
+    )
 
-    except Exception as e:
-        logger.error(
-            f"Unexpected error during user deletion for email {user_request.email}: {str(e)}",
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "InternalServerError",
-                "message": "An unexpected error occurred while deleting the user.",
-            },
-        ) from e
+    return ORJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=_DeleteResponse(**result),
+    )
@@ -1,30 +1,28 @@
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
-
-# Handle imports for both package and direct execution
-try:
-    from Database.core import DBSession
-    from Models.ResponseModel import ResumeDetailResponseModel
-    from Models.UserModel import UserRequestModel
-    from Services.ChatService.GetResumeDetails import GetResumeDetails
-    from utils.exceptions import BaseAppException, handle_app_exception
-    from utils.logger import get_logger
-except ImportError:
-    # Fallback to relative imports when used as a package
-    from ...Database.core import DBSession
-    from ...Models.ResponseModel import ResumeDetailResponseModel
-    from ...Models.UserModel import UserRequestModel
-    from ...Services.ChatService.GetResumeDetails import GetResumeDetails
-    from ...utils.exceptions import BaseAppException, handle_app_exception
-    from ...utils.logger import get_logger
+import re
+
+from fastapi import HTTPException, status
+from fastapi.responses import ORJSONResponse, Response
+
+from Controller.ChatControllers import chat_router
+from Database.core import DBSession
+from Services.ChatService.GetResumeDetails import GetResumeDetails
+from utils.logger import get_logger
+from utils.RedisCache import cache_get, cache_set
 
 logger = get_logger()
 
-router = APIRouter(prefix="/chat", tags=["Chat"])
+# Cheap pre-compiled check for query-param emails; the stricter EmailStr
+# validation is reserved for POST bodies where Pydantic runs anyway
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+_INVALID_EMAIL_DETAIL = {
+    "error": "ValidationError",
+    "message": "Invalid email address",
+}
 
 
-@router.get("/get-resume-details", status_code=status.HTTP_200_OK)
-def getResumeDetails(email: str, db: DBSession):
+@chat_router.get("/get-resume-details", status_code=status.HTTP_200_OK)
+async def getResumeDetails(email: str, db: DBSession):
     """Get resume details for a user.
 
     Args:
@@ -37,53 +35,44 @@ def getResumeDetails(email: str, db: DBSession):
     Raises:
         HTTPException: If resume details retrieval fails
     """
-    logger.info(f"Received get resume details request for email: {email}")
+    logger.info("Received get resume details request for email: %s", email)
 
-    try:
-        # Create UserRequestModel from email
-        user_request = UserRequestModel(email=email)
+    if not _EMAIL_RE.match(email):
+        logger.warning("Invalid email supplied to get-resume-details: %s", email)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_INVALID_EMAIL_DETAIL,
+        )
 
-        # Get resume details from database
-        resume_details, user_id = GetResumeDetails(db, user_request)
+    # Normalize once; services and cache keys rely on lowercase emails
+    email = email.lower()
 
-        logger.info(
-            f"Successfully retrieved {len(resume_details)} resume detail(s) for email: {email}"
-        )
+    # Serve from the lookaside cache when possible (skips DB + serialization)
+    cache_key = f"resume_details:{email}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        logger.debug("Cache hit for resume details, email: %s", email)
+        return Response(content=cached, media_type="application/json")
 
-        # Convert to response models (data is already in string format from service)
-        resume_response_list = [
-            ResumeDetailResponseModel(**detail) for detail in resume_details
-        ]
-
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            content={
-                "message": "Resume details retrieved successfully",
-                "user_id": user_id,
-                "user_email": email,
-                "resume_count": len(resume_details),
-                "resume_details": [
-                    detail.model_dump(mode="json") for detail in resume_response_list
-                ],
-            },
-        )
+    # Get resume details from database
+    resume_details, user_id = await GetResumeDetails(db, email)
 
-    except BaseAppException as e:
-        logger.warning(
-            f"Application exception during resume details retrieval: {e.message}"
-        )
-        http_exception = handle_app_exception(e)
-        raise http_exception
+    logger.info(
+        "Successfully retrieved %d resume detail(s) for email: %s",
+        len(resume_details),
+        email,
+    )
 
-    except Exception as e:
-        logger.error(
-            f"Unexpected error during resume details retrieval for email {email}: {str(e)}",
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "InternalServerError",
-                "message": "An unexpected error occurred while retrieving resume details.",
-            },
-        ) from e
+    # Service already returns JSON-ready dicts, so pass them straight through
+    response = ORJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "message": "Resume details retrieved successfully",
+            "user_id": user_id,
+            "user_email": email,
+            "resume_count": len(resume_details),
+            "resume_details": resume_details,
+        },
+    )
+    await cache_set(cache_key, response.body)
+    return response
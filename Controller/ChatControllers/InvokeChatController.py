@@ -2,30 +2,27 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
-from fastapi.responses import JSONResponse
-
-# Handle imports for both package and direct execution
-try:
-    from Database.core import DBSession
-    from Services.ChatService.InvokeChatService import InvokeChat
-    from utils.exceptions import BaseAppException, handle_app_exception
-    from utils.logger import get_logger
-except ImportError:
-    # Fallback to relative imports when used as a package
-    from ...Database.core import DBSession
-    from ...Services.ChatService.InvokeChatService import InvokeChat
-    from ...utils.exceptions import BaseAppException, handle_app_exception
-    from ...utils.logger import get_logger
+from fastapi import (BackgroundTasks, File, Form, HTTPException, UploadFile,
+                     status)
+from fastapi.responses import ORJSONResponse
+
+from Controller.ChatControllers import chat_router
+from Database.core import DBSession
+from Services.ChatService.InvokeChatService import InvokeChat
+from utils.logger import get_logger
 
 logger = get_logger()
 
-router = APIRouter(prefix="/chat", tags=["Chat"])
+_MISSING_INPUT_DETAIL = {
+    "error": "ValidationError",
+    "message": "Either text or audio input must be provided",
+}
 
 
-@router.post("/invoke", status_code=status.HTTP_200_OK)
-def invoke_chat(
+@chat_router.post("/invoke", status_code=status.HTTP_200_OK)
+async def invoke_chat(
     db: DBSession,
+    background_tasks: BackgroundTasks,
     email: str = Form(..., description="User email address"),
     text: Optional[str] = Form(None, description="Optional text input"),
     audio: Optional[UploadFile] = File(None, description="Optional audio file input"),
@@ -37,6 +34,8 @@ def invoke_chat(
 
     Args:
         db: Database session (injected)
+        background_tasks: Background task queue (injected); used to save
+            the chat turn after the response is sent
         email: User email address (required)
         text: Optional text input
         audio: Optional audio file
@@ -51,74 +50,53 @@ def invoke_chat(
         HTTPException: If chat invocation fails
     """
     logger.info(
-        f"Received chat invocation request for email: {email}, "
-        f"has_text: {text is not None}, has_audio: {audio is not None}"
+        "Received chat invocation request for email: %s, has_text: %s, has_audio: %s",
+        email,
+        text is not None,
+        audio is not None,
     )
 
-    # Validate that at least one input is provided
+    # Validate that at least one input is provided, before any of the spooled
+    # audio upload is read
     if not text and not audio:
         logger.error("Neither text nor audio input provided")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error": "ValidationError",
-                "message": "Either text or audio input must be provided",
-            },
-        )
-
-    try:
-        # Process text input (strip if provided)
-        text_input = text.strip() if text else None
-
-        # Invoke chat service
-        result = InvokeChat(
-            text=text_input,
-            audio=audio,
-            email=email,
-            db=db,
-            model=model,
-            temperature=temperature,
-            top_p=top_p,
-        )
-
-        logger.info(f"Chat invocation completed successfully for email: {email}")
-
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            content={
-                "message": "Chat invocation completed successfully",
-                "data": {
-                    "explanation": result.get("explanation"),
-                    "code": result.get("code"),
-                    "user_id": result.get("user_id"),
-                },
-            },
+            detail=_MISSING_INPUT_DETAIL,
         )
 
-    except BaseAppException as e:
-        logger.warning(f"Application exception during chat invocation: {e.message}")
-        http_exception = handle_app_exception(e)
-        raise http_exception
+    # Normalize once; the services rely on lowercase emails
+    email = email.lower()
+
+    # Process text input; API clients usually send pre-trimmed text, so
+    # only pay for the strip() copy when there is actual whitespace
+    if text and (text[:1].isspace() or text[-1:].isspace()):
+        text_input = text.strip()
+    else:
+        text_input = text or None
+
+    # Invoke chat service
+    result = await InvokeChat(
+        text=text_input,
+        audio=audio,
+        email=email,
+        db=db,
+        model=model,
+        temperature=temperature,
+        top_p=top_p,
+        background_tasks=background_tasks,
+    )
 
-    except ValueError as e:
-        logger.warning(f"Validation error during chat invocation: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error": "ValidationError",
-                "message": str(e),
-            },
-        ) from e
+    logger.info("Chat invocation completed successfully for email: %s", email)
 
-    except Exception as e:
-        logger.error(
-            f"Unexpected error during chat invocation for email {email}: {str(e)}",
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "InternalServerError",
-                "message": "An unexpected error occurred while processing the chat request.",
+    return ORJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "message": "Chat invocation completed successfully",
+            "data": {
+                "explanation": result.get("explanation"),
+                "code": result.get("code"),
+                "user_id": result.get("user_id"),
             },
-        ) from e
+        },
+    )
@@ -1,28 +1,27 @@
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
-from fastapi.responses import JSONResponse
+from dataclasses import dataclass
 
-# Handle imports for both package and direct execution
-try:
-    from Database.core import DBSession
-    from Models.UserModel import UserRequestModel
-    from Services.ChatService.ResumeUploadService import FileUpload
-    from utils.exceptions import BaseAppException, handle_app_exception
-    from utils.logger import get_logger
-except ImportError:
-    # Fallback to relative imports when used as a package
-    from ...Database.core import DBSession
-    from ...Models.UserModel import UserRequestModel
-    from ...Services.ChatService.ResumeUploadService import FileUpload
-    from ...utils.exceptions import BaseAppException, handle_app_exception
-    from ...utils.logger import get_logger
+from fastapi import File, Form, UploadFile, status
+from fastapi.responses import ORJSONResponse
+
+from Controller.ChatControllers import chat_router
+from Database.core import DBSession
+from Models.UserModel import UserRequestModel
+from Services.ChatService.ResumeUploadService import FileUpload
+from utils.logger import get_logger
+from utils.RedisCache import cache_delete
 
 logger = get_logger()
 
-router = APIRouter(prefix="/chat", tags=["Chat"])
+# Fixed response shape; orjson serializes slotted dataclasses natively
+@dataclass(slots=True)
+class _UploadResponse:
+    message: str
+    data: dict
+
 
 
-@router.post("/upload-resume", status_code=status.HTTP_201_CREATED)
-def upload_resume(
+@chat_router.post("/upload-resume", status_code=status.HTTP_201_CREATED)
+async def upload_resume(
     db: DBSession,
     file: UploadFile = File(..., description="Resume file (PDF, DOCX, or TXT)"),
     email: str = Form(..., description="User email address"),
@@ -41,50 +40,35 @@ def upload_resume(
         HTTPException: If file upload or processing fails
     """
     logger.info(
-        f"Received resume upload request for email: {email}, file: {file.filename}"
+        "Received resume upload request for email: %s, file: %s", email, file.filename
     )
 
-    try:
-        # Create UserRequestModel from email
-        user_request = UserRequestModel(email=email)
+    # Create UserRequestModel from email (validates and lowercases it)
+    user_request = UserRequestModel(email=email)
+    email = user_request.email
 
-        # Process file upload
-        result = FileUpload(file, db, user_request)
+    # Process file upload
+    result = await FileUpload(file, db, user_request)
 
-        logger.info(
-            f"Resume successfully uploaded and processed. "
-            f"ChatMemory ID: {result.get('chat_memory_id')}"
-        )
-
-        return JSONResponse(
-            status_code=status.HTTP_201_CREATED,
-            content={
-                "message": "Resume successfully uploaded and processed",
-                "data": {
-                    "filename": result.get("filename"),
-                    "content_type": result.get("content_type"),
-                    "file_size": result.get("file_size"),
-                    "text_length": result.get("text_length"),
-                    "chat_memory_id": result.get("chat_memory_id"),
-                    "user_id": result.get("user_id"),
-                },
-            },
-        )
+    logger.info(
+        "Resume successfully uploaded and processed. ChatMemory ID: %s",
+        result.get("chat_memory_id"),
+    )
 
-    except BaseAppException as e:
-        logger.warning(f"Application exception during resume upload: {e.message}")
-        http_exception = handle_app_exception(e)
-        raise http_exception
+    # Invalidate cached resume details for this email
+    await cache_delete(f"resume_details:{email}")
 
-    except Exception as e:
-        logger.error(
-            f"Unexpected error during resume upload for email {email}: {str(e)}",
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "InternalServerError",
-                "message": "An unexpected error occurred while processing the resume.",
+    return ORJSONResponse(
+        status_code=status.HTTP_201_CREATED,
+        content=_UploadResponse(
+            message="Resume successfully uploaded and processed",
+            data={
+                "filename": result.get("filename"),
+                "content_type": result.get("content_type"),
+                "file_size": result.get("file_size"),
+                "text_length": result.get("text_length"),
+                "chat_memory_id": result.get("chat_memory_id"),
+                "user_id": result.get("user_id"),
             },
-        ) from e
+        ),
+    )
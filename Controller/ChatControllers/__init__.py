@@ -1 +1,20 @@
-"""Chat controllers package."""
+"""Chat controllers package.
+
+All chat endpoints register on a single shared /chat router so FastAPI
+only has one APIRouter per URL namespace to merge at startup.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
+
+chat_router = APIRouter(
+    prefix="/chat",
+    tags=["Chat"],
+    default_response_class=ORJSONResponse,
+)
+
+# Importing the controller modules registers their routes on chat_router
+from Controller.ChatControllers import \
+    GetResumeDetailsController  # noqa: E402,F401
+from Controller.ChatControllers import InvokeChatController  # noqa: E402,F401
+from Controller.ChatControllers import ResumeUploadController  # noqa: E402,F401
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class UserResponseModel(BaseModel):
@@ -24,6 +24,12 @@ class ResumeDetailResponseModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# Built once at import: validating a list of resume records through this
+# adapter runs as a single compiled pydantic-core pass, instead of a Python
+# loop constructing one model per item
+RESUME_LIST_ADAPTER = TypeAdapter(List[ResumeDetailResponseModel])
+
+
 class ResumeDetailsListResponseModel(BaseModel):
     """Response model for list of resume details."""
 
@@ -1,5 +1,12 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, field_validator
 
 
 class UserRequestModel(BaseModel):
     email: EmailStr
+
+    @field_validator("email", mode="after")
+    @classmethod
+    def _lower(cls, v: str) -> str:
+        # Normalize once at construction so every downstream comparison hits
+        # the indexed lowercase value without per-call .lower() copies
+        return v.lower()
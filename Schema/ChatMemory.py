@@ -1,21 +1,50 @@
-import uuid
-
-from sqlalchemy import TEXT, TIMESTAMP, Column, ForeignKey, String, func
+from sqlalchemy import (TEXT, TIMESTAMP, Column, ForeignKey, Index, String,
+                        func, text)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-# Handle imports for both package and direct execution
+# Put the Backend directory on sys.path (works for package and direct use)
 try:
-    from Database.core import Base
+    from utils import import_compat  # noqa: F401
 except ImportError:
-    # Fallback to relative imports when used as a package
-    from ..Database.core import Base
+    from ..utils import import_compat  # noqa: F401
+
+from Database.core import Base
 
 
 class ChatMemory(Base):
     __tablename__ = "chat_memory"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Both hot queries filter on user_id and order by created_at DESC,
+    # and each has a partial index matching it exactly (resume rows are
+    # rare, so the resume one stays tiny and serves index-only scans).
+    # Note: create_all only creates these on fresh tables — existing
+    # deployments need a manual CREATE INDEX CONCURRENTLY.
+    __table_args__ = (
+        Index(
+            "ix_chat_memory_user_resume",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_where=text("resume_details IS NOT NULL"),
+        ),
+        # Mirror image of the resume index for the history query
+        # (user_id AND resume_details IS NULL, newest first, LIMIT 10):
+        # turns the limit into a bounded index range scan instead of a
+        # sort over the user's whole history
+        Index(
+            "ix_chat_memory_user_recent",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_where=text("resume_details IS NULL"),
+        ),
+    )
+
+    # Generated server-side, returned via the insert's implicit RETURNING
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
 
     user_id = Column(
         UUID(as_uuid=True),
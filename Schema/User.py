@@ -1,22 +1,30 @@
-import uuid
-
-from sqlalchemy import Column, String
+from sqlalchemy import Column, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-# Handle imports for both package and direct execution
+# Put the Backend directory on sys.path (works for package and direct use)
 try:
-    from Database.core import Base
+    from utils import import_compat  # noqa: F401
 except ImportError:
-    # Fallback to relative imports when used as a package
-    from ..Database.core import Base
+    from ..utils import import_compat  # noqa: F401
+
+from Database.core import Base
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    email = Column(String, unique=True, nullable=False)
+    # Generated server-side (Postgres 13+): the INSERT ships no id bytes
+    # and RETURNING hands the value back without an extra round-trip
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+    # Emails are normalized to lowercase at the API boundary before they
+    # reach any query or insert, so the plain unique index serves
+    # case-insensitive lookups without a lower(email) functional index
+    email = Column(String, unique=True, nullable=False, index=True)
 
     messages = relationship("ChatMemory", back_populates="user", cascade="all, delete")
 
@@ -24,10 +32,7 @@ class User(Base):
 # Import ChatMemory to ensure it's registered with Base before relationships are resolved
 # This prevents "failed to locate a name" errors when SQLAlchemy initializes the mapper
 try:
-    try:
-        from Schema.ChatMemory import ChatMemory  # noqa: F401
-    except ImportError:
-        from ..Schema.ChatMemory import ChatMemory  # noqa: F401
+    from Schema.ChatMemory import ChatMemory  # noqa: F401
 except ImportError:
     # ChatMemory might not exist yet, that's okay - relationship will use string reference
     pass
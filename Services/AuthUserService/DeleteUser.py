@@ -1,26 +1,26 @@
-# Handle imports for both package and direct execution
+from sqlalchemy import delete
+
+# Put the Backend directory on sys.path (works for package and direct use)
 try:
-    from Database.core import Session
-    from Models.UserModel import UserRequestModel
-    from Schema.User import User
-    from utils.EmailExists import check_email_exists
-    from utils.exceptions import (DatabaseOperationException,
-                                  EmailNotFoundException)
-    from utils.logger import get_logger
+    from utils import import_compat  # noqa: F401
 except ImportError:
-    # Fallback to relative imports when used as a package
-    from ...Database.core import Session
-    from ...Models.UserModel import UserRequestModel
-    from ...Schema.User import User
-    from ...utils.EmailExists import check_email_exists
-    from ...utils.exceptions import (DatabaseOperationException,
-                                     EmailNotFoundException)
-    from ...utils.logger import get_logger
+    from ...utils import import_compat  # noqa: F401
+
+from Database.core import AsyncSession
+from Models.UserModel import UserRequestModel
+from Schema.User import User
+from Services.AuthUserService.GetUser import invalidate_user_cache
+from Services.ChatService.GetResumeDetails import invalidate_resume_cache
+from Services.UserCache import invalidate_user_id
+from utils.DbRetry import retry_on_disconnect
+from utils.exceptions import DatabaseOperationException, EmailNotFoundException
+from utils.logger import get_logger
 
 logger = get_logger()
 
 
-def Delete(db: Session, user: UserRequestModel) -> dict:
+@retry_on_disconnect
+async def Delete(db: AsyncSession, user: UserRequestModel) -> dict:
     """Delete a user account by email.
 
     Args:
@@ -34,32 +34,33 @@ def Delete(db: Session, user: UserRequestModel) -> dict:
         EmailNotFoundException: If email does not exist
         DatabaseOperationException: If database operation fails
     """
-    logger.info(f"Attempting to delete user with email: {user.email}")
+    logger.info("Attempting to delete user with email: %s", user.email)
 
     try:
-        # Check if email exists
-        if not check_email_exists(db, user.email):
-            logger.warning(f"Delete attempt for non-existent email: {user.email}")
-            raise EmailNotFoundException(user.email)
-
-        # Query user to delete
-        user_to_delete = db.query(User).filter(User.email == user.email.lower()).first()
+        # Single DELETE ... RETURNING collapses the existence check, the row
+        # fetch and the delete into one round-trip. Related chat_memory rows
+        # are removed by the ON DELETE CASCADE foreign key.
+        result = await db.execute(
+            delete(User)
+            .where(User.email == user.email)
+            .returning(User.id)
+        )
+        user_id = result.scalar_one_or_none()
 
-        if not user_to_delete:
-            logger.warning(f"User not found in database for email: {user.email}")
+        if user_id is None:
+            await db.rollback()
+            logger.warning("Delete attempt for non-existent email: %s", user.email)
             raise EmailNotFoundException(user.email)
 
-        user_id = user_to_delete.id
-        logger.debug(f"Found user with ID: {user_id} for deletion")
-
-        # Delete user (cascade will handle related records)
-        db.delete(user_to_delete)
-        logger.debug("User marked for deletion in session")
-
         # Commit transaction
-        db.commit()
+        await db.commit()
+        invalidate_user_cache(user.email)
+        invalidate_resume_cache(user.email)
+        invalidate_user_id(user.email)
         logger.info(
-            f"User with ID {user_id} and email {user.email} successfully deleted"
+            "User with ID %s and email %s successfully deleted",
+            user_id,
+            user.email,
         )
 
         return {
@@ -73,8 +74,10 @@ def Delete(db: Session, user: UserRequestModel) -> dict:
         raise
     except Exception as e:
         logger.error(
-            f"Error during user deletion for email {user.email}: {str(e)}",
+            "Error during user deletion for email %s: %s",
+            user.email,
+            e,
             exc_info=True,
         )
-        db.rollback()
+        await db.rollback()
         raise DatabaseOperationException("user_deletion", str(e)) from e
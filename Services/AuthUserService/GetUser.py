@@ -1,50 +1,75 @@
-# Handle imports for both package and direct execution
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+
+# Put the Backend directory on sys.path (works for package and direct use)
 try:
-    from Database.core import Session
-    from Models.UserModel import UserRequestModel
-    from Schema.User import User
-    from utils.exceptions import (DatabaseOperationException,
-                                  EmailNotFoundException)
-    from utils.logger import get_logger
+    from utils import import_compat  # noqa: F401
 except ImportError:
-    # Fallback to relative imports when used as a package
-    from ...Database.core import Session
-    from ...Models.UserModel import UserRequestModel
-    from ...Schema.User import User
-    from ...utils.exceptions import (DatabaseOperationException,
-                                     EmailNotFoundException)
-    from ...utils.logger import get_logger
+    from ...utils import import_compat  # noqa: F401
+
+from Database.core import AsyncSession
+from Schema.User import User
+from utils.DbRetry import retry_on_disconnect
+from utils.exceptions import DatabaseOperationException, EmailNotFoundException
+from utils.logger import get_logger
 
 logger = get_logger()
 
+# Short-TTL lookaside for burst reads (SPA refresh patterns re-request the
+# same user within seconds): a dict hit instead of a DB round-trip, and the
+# 5s window keeps staleness negligible. Everything runs on one event loop,
+# so no locking is needed.
+_user_cache = TTLCache(maxsize=1024, ttl=5)
+
+
+def invalidate_user_cache(email: str) -> None:
+    """Drop the cached row for an email (after delete/update)."""
+    _user_cache.pop(email, None)
 
-def GetUser(db: Session, user: UserRequestModel) -> User:
+
+@retry_on_disconnect
+async def GetUser(db: AsyncSession, email: str) -> Row:
     """Get user information by email.
 
+    Only the (id, email) columns are selected, so the database ships one
+    narrow row and no full ORM entity is hydrated.
+
     Args:
         db: Database session
-        user: User request model containing email
+        email: User email address (validated and lowercased by the caller)
 
     Returns:
-        User: User object with user information
+        Row: Lightweight (id, email) row for the user
 
     Raises:
         EmailNotFoundException: If user email not found in database
         DatabaseOperationException: If database operation fails
     """
-    logger.info(f"Attempting to get user with email: {user.email}")
+    logger.info("Attempting to get user with email: %s", email)
+
+    cached = _user_cache.get(email)
+    if cached is not None:
+        logger.debug("User cache hit for email: %s", email)
+        return cached
 
     try:
-        # Query user from database
-        db_user = db.query(User).filter(User.email == user.email.lower()).first()
+        # Query only the columns the callers need (indexed email lookup)
+        result = await db.execute(
+            select(User.id, User.email).where(User.email == email)
+        )
+        db_user = result.first()
 
         if not db_user:
-            logger.warning(f"User not found for email: {user.email}")
-            raise EmailNotFoundException(user.email)
+            logger.warning("User not found for email: %s", email)
+            raise EmailNotFoundException(email)
 
         logger.info(
-            f"Successfully retrieved user with ID: {db_user.id} for email: {user.email}"
+            "Successfully retrieved user with ID: %s for email: %s",
+            db_user.id,
+            email,
         )
+        _user_cache[email] = db_user
         return db_user
 
     except EmailNotFoundException:
@@ -52,7 +77,6 @@ def GetUser(db: Session, user: UserRequestModel) -> User:
         raise
     except Exception as e:
         logger.error(
-            f"Error retrieving user for email {user.email}: {str(e)}",
-            exc_info=True,
+            "Error retrieving user for email %s: %s", email, e, exc_info=True
         )
         raise DatabaseOperationException("user_retrieval", str(e)) from e
@@ -1,68 +1,64 @@
-import uuid
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
 
-# Handle imports for both package and direct execution
+# Put the Backend directory on sys.path (works for package and direct use)
 try:
-    from Database.core import Session
-    from Models.UserModel import UserRequestModel
-    from Schema.User import User
-    from utils.EmailExists import check_email_exists
-    from utils.exceptions import (DatabaseOperationException,
-                                  EmailAlreadyExistsException)
-    from utils.logger import get_logger
+    from utils import import_compat  # noqa: F401
 except ImportError:
-    # Fallback to relative imports when used as a package
-    from ...Database.core import Session
-    from ...Models.UserModel import UserRequestModel
-    from ...Schema.User import User
-    from ...utils.EmailExists import check_email_exists
-    from ...utils.exceptions import (DatabaseOperationException,
-                                     EmailAlreadyExistsException)
-    from ...utils.logger import get_logger
+    from ...utils import import_compat  # noqa: F401
+
+from Database.core import AsyncSession
+from Models.UserModel import UserRequestModel
+from Schema.User import User
+from utils.DbRetry import retry_on_disconnect
+from utils.exceptions import (DatabaseOperationException,
+                              EmailAlreadyExistsException)
+from utils.logger import get_logger
 
 logger = get_logger()
 
 
-def Signup(db: Session, user: UserRequestModel) -> User:
+@retry_on_disconnect
+async def Signup(db: AsyncSession, user: UserRequestModel) -> Row:
     """Create a new user account.
 
+    Uses a single INSERT ... ON CONFLICT DO NOTHING ... RETURNING statement,
+    so the duplicate check, the insert, and the created-row read all happen
+    in one round-trip.
+
     Args:
         db: Database session
         user: User request model containing email
 
     Returns:
-        User: Created user object
+        Row: Lightweight (id, email) row for the created user
 
     Raises:
         EmailAlreadyExistsException: If email already exists
         DatabaseOperationException: If database operation fails
     """
-    logger.info(f"Attempting to sign up user with email: {user.email}")
+    logger.info("Attempting to sign up user with email: %s", user.email)
 
     try:
-        # Check if email already exists
-        if check_email_exists(db, user.email):
-            logger.warning(f"Signup attempt with existing email: {user.email}")
-            raise EmailAlreadyExistsException(user.email)
-
-        # Generate UUID for new user
-        user_id = uuid.uuid4()
-        logger.debug(f"Generated user ID: {user_id}")
-
-        # Create new user instance
-        new_user = User(id=user_id, email=user.email.lower())
-        logger.debug(f"Created user instance for email: {user.email}")
+        # One statement: insert unless the email exists, and return the row
+        # (the id comes from Postgres' gen_random_uuid() via RETURNING)
+        result = await db.execute(
+            pg_insert(User)
+            .values(email=user.email)
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User.id, User.email)
+        )
+        new_user = result.first()
 
-        # Add user to database
-        db.add(new_user)
-        logger.debug("User added to session")
+        if new_user is None:
+            # RETURNING produced nothing, so the email already existed
+            await db.rollback()
+            logger.warning("Signup attempt with existing email: %s", user.email)
+            raise EmailAlreadyExistsException(user.email)
 
         # Commit transaction
-        db.commit()
-        logger.info(f"User successfully created with ID: {user_id}")
-
-        # Refresh to get updated data
-        db.refresh(new_user)
-        logger.debug("User object refreshed from database")
+        await db.commit()
+        logger.info("User successfully created with ID: %s", new_user.id)
 
         return new_user
 
@@ -71,8 +67,10 @@ def Signup(db: Session, user: UserRequestModel) -> User:
         raise
     except Exception as e:
         logger.error(
-            f"Error during user signup for email {user.email}: {str(e)}",
+            "Error during user signup for email %s: %s",
+            user.email,
+            e,
             exc_info=True,
         )
-        db.rollback()
+        await db.rollback()
         raise DatabaseOperationException("user_creation", str(e)) from e
@@ -1,35 +1,69 @@
+import json
 from typing import Any, Dict, List, Tuple
 
-# Handle imports for both package and direct execution
+from cachetools import TTLCache
+from sqlalchemy import text
+
+# Put the Backend directory on sys.path (works for package and direct use)
 try:
-    from Database.core import Session
-    from Models.UserModel import UserRequestModel
-    from Schema.ChatMemory import ChatMemory
-    from Schema.User import User
-    from utils.exceptions import (DatabaseOperationException,
-                                  EmailNotFoundException)
-    from utils.logger import get_logger
+    from utils import import_compat  # noqa: F401
 except ImportError:
-    # Fallback to relative imports when used as a package
-    from ...Database.core import Session
-    from ...Models.UserModel import UserRequestModel
-    from ...Schema.ChatMemory import ChatMemory
-    from ...Schema.User import User
-    from ...utils.exceptions import (DatabaseOperationException,
-                                     EmailNotFoundException)
-    from ...utils.logger import get_logger
+    from ...utils import import_compat  # noqa: F401
+
+from Database.core import AsyncSession
+from utils.DbRetry import retry_on_disconnect
+from utils.exceptions import DatabaseOperationException, EmailNotFoundException
+from utils.logger import get_logger
 
 logger = get_logger()
 
+# Very short TTL: resume payloads are large and change on upload, so two
+# seconds only soaks up duplicate reads within a burst
+_resume_cache = TTLCache(maxsize=1024, ttl=2)
+
+
+def invalidate_resume_cache(email: str) -> None:
+    """Drop the cached resume details for an email (after upload/delete)."""
+    _resume_cache.pop(email, None)
+
+
+# One round-trip, formatted server-side: Postgres builds the JSON array in C
+# (ids as text, ISO-8601 timestamps), so no ORM rows are hydrated and no
+# per-record Python dicts are built. The LEFT JOIN keeps a row for users
+# with no resume records, which the FILTER clause turns into '[]'.
+_RESUME_DETAILS_SQL = text(
+    """
+    SELECT u.id::text AS user_id,
+           COALESCE(
+               json_agg(
+                   json_build_object(
+                       'id', cm.id::text,
+                       'message', cm.message,
+                       'resume_details', cm.resume_details,
+                       'created_at', to_char(cm.created_at, 'YYYY-MM-DD"T"HH24:MI:SS'),
+                       'role', cm.role
+                   ) ORDER BY cm.created_at DESC
+               ) FILTER (WHERE cm.id IS NOT NULL),
+               '[]'::json
+           ) AS resume_details
+    FROM users u
+    LEFT JOIN chat_memory cm
+           ON cm.user_id = u.id AND cm.resume_details IS NOT NULL
+    WHERE u.email = :email
+    GROUP BY u.id
+    """
+)
+
 
-def GetResumeDetails(
-    db: Session, user: UserRequestModel
+@retry_on_disconnect
+async def GetResumeDetails(
+    db: AsyncSession, email: str
 ) -> Tuple[List[Dict[str, Any]], str]:
     """Get resume details for a user.
 
     Args:
         db: Database session
-        user: User request model containing email
+        email: User email address (validated and lowercased by the caller)
 
     Returns:
         list[dict]: List of resume details with metadata
@@ -38,56 +72,43 @@ def GetResumeDetails(
         EmailNotFoundException: If user email not found in database
         DatabaseOperationException: If database operation fails
     """
-    logger.info(f"Attempting to get resume details for user with email: {user.email}")
+    logger.info("Attempting to get resume details for user with email: %s", email)
+
+    cached = _resume_cache.get(email)
+    if cached is not None:
+        logger.debug("Resume details cache hit for email: %s", email)
+        return cached
 
     try:
-        # First, verify user exists
-        db_user = db.query(User).filter(User.email == user.email.lower()).first()
-
-        if not db_user:
-            logger.warning(f"User not found for email: {user.email}")
-            raise EmailNotFoundException(user.email)
-
-        logger.debug(f"Found user with ID: {db_user.id} for email: {user.email}")
-
-        # Query resume details from ChatMemory
-        resume_records = (
-            db.query(ChatMemory)
-            .filter(
-                ChatMemory.user_id == db_user.id,
-                ChatMemory.resume_details.isnot(None),
-            )
-            .order_by(ChatMemory.created_at.desc())
-            .all()
+        result = await db.execute(
+            _RESUME_DETAILS_SQL, {"email": email}
         )
+        row = result.first()
+
+        if row is None:
+            logger.warning("User not found for email: %s", email)
+            raise EmailNotFoundException(email)
+
+        user_id, resume_details = row
+        # asyncpg hands json columns back as text rather than parsed objects
+        if isinstance(resume_details, str):
+            resume_details = json.loads(resume_details)
 
         logger.info(
-            f"Found {len(resume_records)} resume record(s) for user: {user.email}"
+            "Found %d resume record(s) for user: %s", len(resume_details), email
         )
 
-        # Format response
-        resume_details = []
-        for record in resume_records:
-            resume_details.append(
-                {
-                    "id": str(record.id),
-                    "message": record.message,
-                    "resume_details": record.resume_details,
-                    "created_at": (
-                        record.created_at.isoformat() if record.created_at else None
-                    ),
-                    "role": record.role,
-                }
-            )
-
-        return resume_details, str(db_user.id)
+        _resume_cache[email] = (resume_details, user_id)
+        return resume_details, user_id
 
     except EmailNotFoundException:
         # Re-raise application exceptions
         raise
     except Exception as e:
         logger.error(
-            f"Error retrieving resume details for email {user.email}: {str(e)}",
+            "Error retrieving resume details for email %s: %s",
+            email,
+            e,
             exc_info=True,
         )
         raise DatabaseOperationException("resume_retrieval", str(e)) from e
@@ -1,70 +1,85 @@
 """Service for invoking chat with text or audio input."""
 
+import asyncio
 import os
-import sys
 import tempfile
-from pathlib import Path
 from typing import Any, Dict, Optional
 
-# Handle imports for both package and direct execution
+from fastapi import BackgroundTasks
+from sqlalchemy import insert, select
+
+# Put the Backend directory on sys.path (works for package and direct use)
 try:
-    from Database.core import Session
-    from Models.UserModel import UserRequestModel
-    from Schema.ChatMemory import ChatMemory
-    from Schema.User import User
-    from Services.ChatService.GetResumeDetails import GetResumeDetails
-    from utils.exceptions import (BaseAppException, DatabaseOperationException,
-                                  EmailNotFoundException)
-    from utils.logger import get_logger
-    from utils.TranscribeAudio import TranscribeAudio
-    from WorkFlow.chain import GetChain
-    from WorkFlow.ChatModel import ChatResponseModel
+    from utils import import_compat  # noqa: F401
 except ImportError:
-    # Fallback to relative imports when used as a package
-    try:
-        from ...Database.core import Session
-        from ...Models.UserModel import UserRequestModel
-        from ...Schema.ChatMemory import ChatMemory
-        from ...Schema.User import User
-        from ...Services.ChatService.GetResumeDetails import GetResumeDetails
-        from ...utils.exceptions import (BaseAppException,
-                                         DatabaseOperationException,
-                                         EmailNotFoundException)
-        from ...utils.logger import get_logger
-        from ...utils.TranscribeAudio import TranscribeAudio
-        from ...WorkFlow.chain import GetChain
-        from ...WorkFlow.ChatModel import ChatResponseModel
-    except ImportError:
-        # Last resort: add parent to path and try again
-        backend_dir = Path(__file__).parent.parent.parent
-        if str(backend_dir) not in sys.path:
-            sys.path.insert(0, str(backend_dir))
-        from pathlib import Path
-
-        from Database.core import Session
-        from Models.UserModel import UserRequestModel
-        from Schema.ChatMemory import ChatMemory
-        from Schema.User import User
-        from Services.ChatService.GetResumeDetails import GetResumeDetails
-        from utils.exceptions import (BaseAppException,
-                                      DatabaseOperationException,
-                                      EmailNotFoundException)
-        from utils.logger import get_logger
-        from utils.TranscribeAudio import TranscribeAudio
-        from WorkFlow.chain import GetChain
-        from WorkFlow.ChatModel import ChatResponseModel
+    from ...utils import import_compat  # noqa: F401
+
+from Database.core import AsyncSession, get_session_factory
+from Schema.ChatMemory import ChatMemory
+from Services.ChatService.GetResumeDetails import GetResumeDetails
+from Services.UserCache import get_user_id
+from utils.exceptions import (BaseAppException, DatabaseOperationException,
+                              EmailNotFoundException)
+from utils.logger import get_logger
+from utils.TranscribeAudio import TranscribeAudio
+from WorkFlow.chain import GetChain
+from WorkFlow.ChatModel import ChatResponseModel
 
 logger = get_logger()
 
+# LLM cost and latency scale with tokens, so both the combined input and
+# the history context get a hard character budget; long audio transcripts
+# keep their most recent tail rather than being rejected
+MAX_INPUT_CHARS = int(os.getenv("MAX_INPUT_CHARS", "8000"))
+MAX_HISTORY_CHARS = int(os.getenv("MAX_HISTORY_CHARS", "6000"))
+
+# Bound concurrent outbound LLM calls: a burst of chat requests otherwise
+# opens one provider connection each, trading 429 retries for even more
+# latency. Requests past the limit queue here instead
+LLM_SEM = asyncio.Semaphore(int(os.getenv("LLM_CONCURRENCY", "8")))
+
+
+async def _persist_chat(user_id: Any, user_text: str, assistant_text: str) -> None:
+    """Persist a chat turn after the response has been sent.
+
+    Runs as a background task, so it opens its own short-lived session —
+    the request-scoped one is closed by the time this executes.
+    """
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        try:
+            await session.execute(
+                insert(ChatMemory).values(
+                    [
+                        {
+                            "user_id": user_id,
+                            "message": user_text,
+                            "role": "user",
+                        },
+                        {
+                            "user_id": user_id,
+                            "message": assistant_text,
+                            "role": "assistant",
+                        },
+                    ]
+                )
+            )
+            await session.commit()
+            logger.debug("Conversation saved to database")
+        except Exception as e:
+            logger.warning("Error saving conversation in background: %s", e)
+            await session.rollback()
 
-def InvokeChat(
+
+async def InvokeChat(
     text: Optional[str],
     audio: Optional[Any],  # UploadFile from FastAPI
     email: str,
-    db: Session,
+    db: AsyncSession,
     model: str = "openai/gpt-oss-120b",
     temperature: float = 0.6,
     top_p: float = 0.95,
+    background_tasks: Optional[BackgroundTasks] = None,
 ) -> Dict[str, Any]:
     """Invoke chat with text or audio input.
 
@@ -76,6 +91,8 @@ def InvokeChat(
         model: Model name to use (default: "openai/gpt-oss-120b")
         temperature: Sampling temperature (default: 0.6)
         top_p: Nucleus sampling parameter (default: 0.95)
+        background_tasks: Optional FastAPI BackgroundTasks; when provided,
+            the chat turn is persisted after the response is sent
 
     Returns:
         dict: Response containing explanation and code from the chain
@@ -85,7 +102,7 @@ def InvokeChat(
         DatabaseOperationException: If database operation fails
         ValueError: If neither text nor audio is provided
     """
-    logger.info(f"Invoking chat for user: {email}")
+    logger.info("Invoking chat for user: %s", email)
 
     # Validate that at least one input is provided
     if not text and not audio:
@@ -93,61 +110,126 @@ def InvokeChat(
         raise ValueError("Either text or audio input must be provided")
 
     try:
-        # Create UserRequestModel
-        user_request = UserRequestModel(email=email)
-
-        # Get resume details
-        logger.debug("Fetching resume details")
-        resume_details_list, user_id = GetResumeDetails(db, user_request)
-
-        # Extract resume details text (use the most recent one)
-        resume_details_text = ""
-        if resume_details_list:
-            # Get the most recent resume details
-            latest_resume = resume_details_list[0]
-            resume_details_text = latest_resume.get("resume_details", "") or ""
-            logger.debug(f"Using resume details from record: {latest_resume.get('id')}")
-        else:
-            logger.warning(f"No resume details found for user: {email}")
-            resume_details_text = "No resume details available."
-
-        # Process audio if provided
-        transcribed_text = ""
+        # Kick off transcription first so the Groq round-trip overlaps
+        # with the context fetches below. The request session can't run
+        # concurrent queries, so the DB steps stay sequential on it while
+        # the transcription task runs on the loop — same overlap as a
+        # gather, with the audio errors kept separable
+        transcribe_future = None
+        buf = None
         if audio:
             logger.info("Processing audio input")
-            # Save audio to temporary file
-            temp_audio_path = None
+            # Buffer the upload (1MB chunks) and hand the buffer straight
+            # to the transcriber. Spooling keeps typical short clips
+            # entirely in RAM but silently overflows long recordings to
+            # disk instead of holding them in memory
+            buf = tempfile.SpooledTemporaryFile(max_size=2 << 20)
+            while chunk := await audio.read(1 << 20):
+                buf.write(chunk)
+            buf.seek(0)
+            transcribe_future = asyncio.ensure_future(
+                TranscribeAudio(buf, audio.filename or "audio.wav")
+            )
+
+        # The context fetches below can fail (unknown email is the common
+        # case) before the transcription is ever awaited. Without cleanup
+        # the task would keep running — a paid API call per bad request —
+        # and dump "Task exception was never retrieved" noise if it
+        # fails, so any exception here cancels and drains it first
+        try:
+            # Get resume details
+            logger.debug("Fetching resume details")
+            resume_details_list, user_id = await GetResumeDetails(db, email)
+
+            # Extract resume details text (use the most recent one)
+            resume_details_text = ""
+            if resume_details_list:
+                # Get the most recent resume details
+                latest_resume = resume_details_list[0]
+                resume_details_text = latest_resume.get("resume_details", "") or ""
+                logger.debug(
+                    "Using resume details from record: %s", latest_resume.get("id")
+                )
+            else:
+                logger.warning("No resume details found for user: %s", email)
+                resume_details_text = "No resume details available."
+
+            # Get conversation history from ChatMemory
+            logger.debug("Fetching conversation history")
+            history_messages = []
+            db_user_id = None
             try:
-                # Create temporary file
-                suffix = Path(audio.filename).suffix if audio.filename else ".wav"
-                with tempfile.NamedTemporaryFile(
-                    delete=False, suffix=suffix
-                ) as temp_file:
-                    temp_audio_path = temp_file.name
-                    # Write audio content to temp file
-                    content = audio.file.read()
-                    temp_file.write(content)
-                    logger.debug(f"Saved audio to temporary file: {temp_audio_path}")
-
-                # Transcribe audio
-                transcribed_text = TranscribeAudio(temp_audio_path)
-                logger.info(
-                    f"Audio transcribed successfully. Length: {len(transcribed_text)} characters"
+                db_user_id = await get_user_id(db, email)
+                if db_user_id is not None:
+                    # Get recent chat messages (excluding resume details). Only
+                    # the message column is selected: hydrating full ChatMemory
+                    # entities would drag every TEXT column over the wire just to
+                    # read .message off each row
+                    result = await db.execute(
+                        select(ChatMemory.message)
+                        .where(
+                            ChatMemory.user_id == db_user_id,
+                            ChatMemory.resume_details.is_(None),  # Exclude resume uploads
+                        )
+                        .order_by(ChatMemory.created_at.desc())
+                        .limit(10)  # Get last 10 messages for context
+                    )
+
+                    # Most recent first from the DB; drop consecutive duplicates
+                    # (repeated questions waste prompt tokens) and cap total
+                    # characters while walking newest-to-oldest, then reverse
+                    # into chat order — the row LIMIT alone doesn't bound
+                    # total context size
+                    history_messages = []
+                    history_chars = 0
+                    for msg in result.scalars().all():
+                        if not msg:
+                            continue
+                        if history_messages and history_messages[-1] == msg:
+                            continue
+                        history_chars += len(msg)
+                        if history_messages and history_chars > MAX_HISTORY_CHARS:
+                            break
+                        history_messages.append(msg)
+                    history_messages.reverse()
+
+                    logger.debug(
+                        "Retrieved %d messages from history", len(history_messages)
+                    )
+            except Exception as e:
+                logger.warning(
+                    "Error fetching conversation history: %s. Continuing without history.",
+                    e,
                 )
+        except BaseException:
+            if transcribe_future is not None:
+                transcribe_future.cancel()
+                try:
+                    await transcribe_future
+                except (asyncio.CancelledError, Exception):
+                    pass
+                # The transcriber only closes handles it opened itself;
+                # the spool (and any rolled-over temp file) is ours
+                buf.close()
+            raise
 
+        # Join the transcription, if any
+        transcribed_text = ""
+        if transcribe_future is not None:
+            try:
+                transcribed_text = await transcribe_future
+                logger.info(
+                    "Audio transcribed successfully. Length: %d characters",
+                    len(transcribed_text),
+                )
             except Exception as e:
-                logger.error(f"Error processing audio: {str(e)}", exc_info=True)
+                logger.error("Error processing audio: %s", e, exc_info=True)
                 raise DatabaseOperationException("audio_processing", str(e)) from e
             finally:
-                # Clean up temporary file
-                if temp_audio_path and os.path.exists(temp_audio_path):
-                    try:
-                        os.unlink(temp_audio_path)
-                        logger.debug(
-                            f"Cleaned up temporary audio file: {temp_audio_path}"
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to delete temporary file: {e}")
+                # The transcriber only closes handles it opened itself;
+                # closing the spool here releases the rolled-over temp
+                # file and its fd for recordings that overflowed to disk
+                buf.close()
 
         # Combine text inputs
         input_text = ""
@@ -163,85 +245,59 @@ def InvokeChat(
             logger.error("No text input available after processing")
             raise ValueError("No text input available after processing audio")
 
-        logger.debug(f"Final input text length: {len(input_text)} characters")
-
-        # Get conversation history from ChatMemory
-        logger.debug("Fetching conversation history")
-        history_messages = []
-        try:
-            db_user = db.query(User).filter(User.email == email.lower()).first()
-            if db_user:
-                # Get recent chat messages (excluding resume details)
-                chat_messages = (
-                    db.query(ChatMemory)
-                    .filter(
-                        ChatMemory.user_id == db_user.id,
-                        ChatMemory.resume_details.is_(None),  # Exclude resume uploads
-                    )
-                    .order_by(ChatMemory.created_at.desc())
-                    .limit(10)  # Get last 10 messages for context
-                    .all()
-                )
-
-                # Format history (most recent first, but we'll reverse for context)
-                for msg in reversed(chat_messages):
-                    if msg.message:
-                        history_messages.append(msg.message)
-
-                logger.debug(f"Retrieved {len(history_messages)} messages from history")
-        except Exception as e:
-            logger.warning(
-                f"Error fetching conversation history: {e}. Continuing without history."
+        if len(input_text) > MAX_INPUT_CHARS:
+            logger.info(
+                "Input text truncated from %d to %d characters",
+                len(input_text),
+                MAX_INPUT_CHARS,
             )
+            # Keep the most recent portion: with long transcripts, the end
+            # carries the question actually being asked
+            input_text = input_text[-MAX_INPUT_CHARS:]
 
-        # Invoke the chain
+        logger.debug("Final input text length: %d characters", len(input_text))
+
+        # Invoke the chain (cached per model configuration; the per-turn
+        # values travel in the invoke payload)
         logger.info("Invoking chain with resume details and input")
-        chain = GetChain(
-            ResumeDetails=resume_details_text,
-            input=input_text,
-            history=history_messages,
-            model=model,
-            temperature=temperature,
-            top_p=top_p,
-        )
+        chain = GetChain(model=model, temperature=temperature, top_p=top_p)
 
-        # Invoke the chain (pass empty dict as the chain expects minimal input)
+        # Invoke the chain (async LLM call, gated by the provider
+        # concurrency limit)
         logger.debug("Executing chain")
-        result: ChatResponseModel = chain.invoke({"input": input_text})
+        async with LLM_SEM:
+            result: ChatResponseModel = await chain.ainvoke(
+                {
+                    "ResumeDetails": resume_details_text,
+                    "input": input_text,
+                    "history": history_messages,
+                }
+            )
 
-        # Save the conversation to ChatMemory
-        logger.debug("Saving conversation to database")
+        # Save the conversation to ChatMemory. The answer doesn't depend
+        # on the save, so with a request context the commit happens after
+        # the response has gone out instead of blocking it
         try:
-            if db_user:
-                # Save user message
-                user_message = ChatMemory(
-                    user_id=db_user.id,
-                    message=input_text,
-                    role="user",
+            if db_user_id is not None:
+                assistant_text = (
+                    f"Explanation: {result.explanation}\n\nCode: {result.code}"
+                    if result.code
+                    else result.explanation
                 )
-                db.add(user_message)
-
-                # Save assistant response
-                assistant_message = ChatMemory(
-                    user_id=db_user.id,
-                    message=(
-                        f"Explanation: {result.explanation}\n\nCode: {result.code}"
-                        if result.code
-                        else result.explanation
-                    ),
-                    role="assistant",
-                )
-                db.add(assistant_message)
 
-                db.commit()
-                logger.debug("Conversation saved to database")
+                if background_tasks is not None:
+                    logger.debug("Scheduling conversation save in background")
+                    background_tasks.add_task(
+                        _persist_chat, db_user_id, input_text, assistant_text
+                    )
+                else:
+                    # Direct callers without a request context save inline
+                    await _persist_chat(db_user_id, input_text, assistant_text)
         except Exception as e:
             logger.warning(
-                f"Error saving conversation to database: {e}. Continuing without saving."
+                "Error saving conversation to database: %s. Continuing without saving.",
+                e,
             )
-            db.rollback()
-            
-        print("Result from invoke service:",result.code)
 
         # Format response
         response_data = {
@@ -262,7 +318,9 @@ def InvokeChat(
         raise
     except Exception as e:
         logger.error(
-            f"Error invoking chat for email {email}: {str(e)}",
+            "Error invoking chat for email %s: %s",
+            email,
+            e,
             exc_info=True,
         )
         raise DatabaseOperationException("chat_invocation", str(e)) from e
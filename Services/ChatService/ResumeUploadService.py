@@ -1,40 +1,76 @@
-import shutil
-import uuid
+import asyncio
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from docling.datamodel.base_models import DocumentStream
 from docling.document_converter import DocumentConverter
 from fastapi import HTTPException, UploadFile, status
 
-# Handle imports for both package and direct execution
+# Put the Backend directory on sys.path (works for package and direct use)
 try:
-    from Database.core import Session
-    from Models.UserModel import UserRequestModel
-    from Schema.ChatMemory import ChatMemory
-    from Schema.User import User
-    from utils.exceptions import (BaseAppException, DatabaseOperationException,
-                                  EmailNotFoundException)
-    from utils.logger import get_logger
+    from utils import import_compat  # noqa: F401
 except ImportError:
-    # Fallback to relative imports when used as a package
-    from ...Database.core import Session
-    from ...Models.UserModel import UserRequestModel
-    from ...Schema.ChatMemory import ChatMemory
-    from ...Schema.User import User
-    from ...utils.exceptions import (BaseAppException,
-                                     DatabaseOperationException,
-                                     EmailNotFoundException)
-    from ...utils.logger import get_logger
+    from ...utils import import_compat  # noqa: F401
+
+from Database.core import AsyncSession
+from Models.UserModel import UserRequestModel
+from Schema.ChatMemory import ChatMemory
+from Services.ChatService.GetResumeDetails import invalidate_resume_cache
+from Services.UserCache import get_user_id
+from utils.exceptions import (BaseAppException, DatabaseOperationException,
+                              EmailNotFoundException)
+from utils.logger import get_logger
+from WorkFlow.chain import clear_system_prompt_cache
 
 logger = get_logger()
 
-UPLOAD_DIR = Path("temp")
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-ALLOWED_TYPES = {
-    "application/pdf",
-    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",  # .docx
-    "text/plain",
-}
+COPY_CHUNK_SIZE = 1 << 20  # 1MB chunks keep memory flat while streaming
+_MIME_ALLOWED = frozenset(
+    {
+        "application/pdf",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",  # .docx
+        "text/plain",
+    }
+)
+# Some clients send application/octet-stream for perfectly good PDFs, so
+# a recognized extension is accepted even when the MIME type is not
+_EXT_ALLOWED = frozenset({".pdf", ".docx", ".txt"})
+
+# docling loads its layout/OCR/table models when the converter is built —
+# seconds of work that is identical for every upload — so one warm
+# instance is shared process-wide. The lock only guards construction.
+_CONVERTER: Optional[DocumentConverter] = None
+_CONVERTER_LOCK = threading.Lock()
+
+# Conversion is CPU-heavy but docling's native parsing releases the GIL,
+# so a pool sized to the machine lets concurrent uploads actually overlap
+# instead of competing with the default executor's unrelated to_thread work
+_CPU_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4,
+    thread_name_prefix="doc-convert",
+)
+
+
+def _get_converter() -> DocumentConverter:
+    """Return the process-wide DocumentConverter, building it on first use."""
+    global _CONVERTER
+    if _CONVERTER is None:
+        with _CONVERTER_LOCK:
+            if _CONVERTER is None:
+                logger.info("Initializing shared DocumentConverter")
+                _CONVERTER = DocumentConverter()
+    return _CONVERTER
+
+
+def _convert_document(source: DocumentStream) -> str:
+    """Convert a document stream and export its text (runs on the CPU pool)."""
+    result = _get_converter().convert(source)
+    return result.document.export_to_text()
 
 
 class FileUploadException(BaseAppException):
@@ -53,7 +89,9 @@ class FileProcessingException(BaseAppException):
         self.details = details
 
 
-def FileUpload(file: UploadFile, db: Session, user: UserRequestModel) -> Dict[str, Any]:
+async def FileUpload(
+    file: UploadFile, db: AsyncSession, user: UserRequestModel
+) -> Dict[str, Any]:
     """Upload and process a resume file, extracting text content and saving to database.
 
     Args:
@@ -71,10 +109,25 @@ def FileUpload(file: UploadFile, db: Session, user: UserRequestModel) -> Dict[st
         DatabaseOperationException: If database operation fails
         HTTPException: For unexpected errors
     """
+    # Cheap request-shape validation first: a malformed upload is rejected
+    # before it costs a user lookup or touches any bytes
     if not file.filename:
         logger.warning("File upload attempted without filename")
         raise FileUploadException("Filename is required")
 
+    if (
+        file.content_type not in _MIME_ALLOWED
+        and Path(file.filename).suffix.lower() not in _EXT_ALLOWED
+    ):
+        logger.warning(
+            f"Unsupported file type attempted: {file.content_type} "
+            f"({file.filename})"
+        )
+        raise FileUploadException(
+            f"Unsupported file type: {file.content_type}. "
+            f"Allowed types: PDF, DOCX, TXT"
+        )
+
     logger.info(
         f"Processing file upload: {file.filename} (type: {file.content_type}) "
         f"for user: {user.email}"
@@ -82,11 +135,11 @@ def FileUpload(file: UploadFile, db: Session, user: UserRequestModel) -> Dict[st
 
     # Get user from database
     try:
-        db_user = db.query(User).filter(User.email == user.email.lower()).first()
-        if not db_user:
+        user_id = await get_user_id(db, user.email)
+        if user_id is None:
             logger.warning(f"User not found for email: {user.email}")
             raise EmailNotFoundException(user.email)
-        logger.debug(f"Found user with ID: {db_user.id} for email: {user.email}")
+        logger.debug(f"Found user with ID: {user_id} for email: {user.email}")
     except EmailNotFoundException:
         raise
     except Exception as e:
@@ -94,60 +147,42 @@ def FileUpload(file: UploadFile, db: Session, user: UserRequestModel) -> Dict[st
         raise DatabaseOperationException("user_lookup", str(e)) from e
 
     try:
-        # Validate file type
-        if file.content_type not in ALLOWED_TYPES:
-            logger.warning(f"Unsupported file type attempted: {file.content_type}")
-            raise FileUploadException(
-                f"Unsupported file type: {file.content_type}. "
-                f"Allowed types: PDF, DOCX, TXT"
-            )
-
-        # Create upload directory
-        UPLOAD_DIR.mkdir(exist_ok=True)
-        logger.debug(f"Upload directory: {UPLOAD_DIR.absolute()}")
-
-        # Generate unique filename to avoid conflicts
-        file_extension = Path(file.filename).suffix
-        unique_filename = f"{uuid.uuid4()}{file_extension}"
-        file_path = UPLOAD_DIR / unique_filename
-
-        logger.debug(f"Saving file to: {file_path}")
-
-        # Save uploaded file
-        try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-
-            # Check file size
-            file_size = file_path.stat().st_size
-            logger.debug(f"File size: {file_size} bytes")
-
+        # Buffer the upload in memory in fixed-size chunks, enforcing the
+        # size cap as bytes arrive. Docling accepts a DocumentStream, so
+        # the old write/convert-from-path/unlink disk round-trip is gone
+        await file.seek(0)
+        file_size = 0
+        buf = io.BytesIO()
+        while chunk := await file.read(COPY_CHUNK_SIZE):
+            file_size += len(chunk)
             if file_size > MAX_FILE_SIZE:
                 logger.warning(
-                    f"File too large: {file_size} bytes (max: {MAX_FILE_SIZE})"
+                    f"File too large: over {file_size} bytes "
+                    f"(max: {MAX_FILE_SIZE}), aborting mid-stream"
                 )
                 raise FileUploadException(
-                    f"File size ({file_size} bytes) exceeds maximum allowed size ({MAX_FILE_SIZE} bytes)"
+                    f"File size exceeds maximum allowed size ({MAX_FILE_SIZE} bytes)"
                 )
+            buf.write(chunk)
+
+        logger.debug(f"File size: {file_size} bytes")
 
-            if file_size == 0:
-                logger.warning("Empty file uploaded")
-                raise FileUploadException("File is empty")
+        if file_size == 0:
+            logger.warning("Empty file uploaded")
+            raise FileUploadException("File is empty")
 
-        except OSError as e:
-            logger.error(f"Error saving file: {str(e)}", exc_info=True)
-            raise FileUploadException("Failed to save uploaded file", details=str(e))
+        buf.seek(0)
 
-        # Process file with DocumentConverter
+        # Process file with the shared DocumentConverter
         try:
-            logger.debug("Initializing DocumentConverter")
-            converter = DocumentConverter()
-            logger.debug(f"Converting file: {file_path}")
+            logger.debug(f"Converting in-memory upload: {file.filename}")
 
-            result = converter.convert(str(file_path))
+            # Blocking CPU-heavy conversion + text export, run on the CPU pool
+            stream = DocumentStream(name=file.filename, stream=buf)
+            extracted_text = await asyncio.get_running_loop().run_in_executor(
+                _CPU_POOL, _convert_document, stream
+            )
             logger.debug("File conversion successful")
-
-            extracted_text = result.document.export_to_text()
             logger.debug(f"Extracted text length: {len(extracted_text)} characters")
 
             if not extracted_text or not extracted_text.strip():
@@ -159,16 +194,21 @@ def FileUpload(file: UploadFile, db: Session, user: UserRequestModel) -> Dict[st
 
             # Save extracted text to database
             try:
+                # The id is generated by Postgres and comes back through the
+                # insert's RETURNING; expire_on_commit=False keeps it
+                # readable after commit without a SELECT
                 chat_memory = ChatMemory(
-                    user_id=db_user.id,
+                    user_id=user_id,
                     role="user",
                     message=f"Resume uploaded: {file.filename}",
                     resume_details=extracted_text,
                 )
 
                 db.add(chat_memory)
-                db.commit()
-                db.refresh(chat_memory)
+                await db.commit()
+                invalidate_resume_cache(user.email)
+                # The formatted system prompt embeds the resume text
+                clear_system_prompt_cache()
 
                 logger.info(
                     f"Successfully saved resume to database. "
@@ -180,7 +220,7 @@ def FileUpload(file: UploadFile, db: Session, user: UserRequestModel) -> Dict[st
                     f"Error saving resume to database: {str(db_error)}",
                     exc_info=True,
                 )
-                db.rollback()
+                await db.rollback()
                 raise DatabaseOperationException(
                     "resume_save",
                     str(db_error),
@@ -198,7 +238,7 @@ def FileUpload(file: UploadFile, db: Session, user: UserRequestModel) -> Dict[st
                 "extracted_text": extracted_text,
                 "text_length": len(extracted_text),
                 "chat_memory_id": str(chat_memory.id),
-                "user_id": str(db_user.id),
+                "user_id": str(user_id),
             }
 
         except FileProcessingException:
@@ -214,17 +254,6 @@ def FileUpload(file: UploadFile, db: Session, user: UserRequestModel) -> Dict[st
                 details=str(e),
             ) from e
 
-        finally:
-            # Cleanup temp file
-            try:
-                if file_path.exists():
-                    file_path.unlink()
-                    logger.debug(f"Cleaned up temporary file: {file_path}")
-            except Exception as cleanup_error:
-                logger.warning(
-                    f"Failed to cleanup temporary file {file_path}: {str(cleanup_error)}"
-                )
-
     except (
         FileUploadException,
         FileProcessingException,
@@ -0,0 +1,50 @@
+"""Shared email -> user id resolution with a TTL cache.
+
+InvokeChat and FileUpload both resolve the same user by email on every
+call; ids are immutable for the lifetime of a user, so a five-minute
+cache removes one SELECT per chat turn and per upload. Entries are
+dropped eagerly on signup and delete, so the TTL only matters for writes
+made outside this process.
+"""
+
+# Put the Backend directory on sys.path (works for package and direct use)
+try:
+    from utils import import_compat  # noqa: F401
+except ImportError:
+    from ..utils import import_compat  # noqa: F401
+
+from typing import Optional
+from uuid import UUID
+
+from cachetools import TTLCache
+from sqlalchemy import select
+
+from Database.core import AsyncSession
+from Schema.User import User
+from utils.logger import get_logger
+
+logger = get_logger()
+
+_user_id_cache = TTLCache(maxsize=10_000, ttl=300)
+
+
+async def get_user_id(db: AsyncSession, email: str) -> Optional[UUID]:
+    """Resolve a (lowercased) email to its user id, hitting the DB on miss.
+
+    Returns:
+        UUID | None: The user's id, or None when no such user exists.
+    """
+    user_id = _user_id_cache.get(email)
+    if user_id is not None:
+        return user_id
+
+    result = await db.execute(select(User.id).where(User.email == email))
+    user_id = result.scalar_one_or_none()
+    if user_id is not None:
+        _user_id_cache[email] = user_id
+    return user_id
+
+
+def invalidate_user_id(email: str) -> None:
+    """Drop the cached id for an email (after signup/delete)."""
+    _user_id_cache.pop(email, None)
@@ -1,29 +1,14 @@
 """Pydantic model for structured LLM output with explanation and code."""
 
-import sys
-from pathlib import Path
-
 from pydantic import BaseModel, ConfigDict, Field
 
-# Add parent directory to path when running directly
-if __name__ == "__main__":
-    backend_dir = Path(__file__).parent.parent
-    if str(backend_dir) not in sys.path:
-        sys.path.insert(0, str(backend_dir))
-
-# Handle imports for both package and direct execution
+# Put the Backend directory on sys.path (works for package and direct use)
 try:
-    from utils.logger import get_logger
+    from utils import import_compat  # noqa: F401
 except ImportError:
-    # Fallback to relative imports when used as a package
-    try:
-        from ..utils.logger import get_logger
-    except ImportError:
-        # Last resort: add parent to path and try again
-        backend_dir = Path(__file__).parent.parent
-        if str(backend_dir) not in sys.path:
-            sys.path.insert(0, str(backend_dir))
-        from utils.logger import get_logger
+    from ..utils import import_compat  # noqa: F401
+
+from utils.logger import get_logger
 
 logger = get_logger()
 
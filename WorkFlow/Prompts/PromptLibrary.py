@@ -5,17 +5,10 @@ from typing import List
 from langchain_core.prompts import PromptTemplate
 
 
-def SystemPrompt(ResumeDetails: str) -> PromptTemplate:
-    """Create system prompt template for the interview chat.
-
-    Args:
-        ResumeDetails: Resume details string to include in the prompt
-
-    Returns:
-        PromptTemplate: System prompt template
-    """
-    prompt = PromptTemplate(
-        input_variables=["ResumeDetails"],
+# Templates are static — only the substitution values vary per call — so
+# they are parsed once at import instead of on every chat turn
+_SYSTEM_TEMPLATE = PromptTemplate(
+    input_variables=["ResumeDetails"],
         template="""
         
         You are an AI system acting strictly as a HUMAN JOB CANDIDATE in a live interview.
@@ -58,23 +51,10 @@ def SystemPrompt(ResumeDetails: str) -> PromptTemplate:
             - explanation: A clear and detailed explanation of your answer
             - code: Any relevant code snippets or examples (if applicable, otherwise empty string)
         """,
-    )
-
-    return prompt
-
+)
 
-def InvokePrompt(input: str, history: List[str]) -> PromptTemplate:
-    """Create invoke prompt template for user input and conversation history.
-
-    Args:
-        input: Current user input/question
-        history: List of previous conversation messages
-
-    Returns:
-        PromptTemplate: Invoke prompt template
-    """
-    prompt = PromptTemplate(
-        input_variables=["input", "history"],
+_INVOKE_TEMPLATE = PromptTemplate(
+    input_variables=["input", "history"],
         template="""
         
         Use the conversation context and current question to generate the next reply.
@@ -97,6 +77,31 @@ def InvokePrompt(input: str, history: List[str]) -> PromptTemplate:
             FINAL ANSWER:
         
         """,
-    )
+)
+
 
-    return prompt
+def SystemPrompt(ResumeDetails: str) -> PromptTemplate:
+    """Return the system prompt template for the interview chat.
+
+    Args:
+        ResumeDetails: Resume details string (substituted by the caller
+            via ``.format(...)``; kept for signature compatibility)
+
+    Returns:
+        PromptTemplate: System prompt template
+    """
+    return _SYSTEM_TEMPLATE
+
+
+def InvokePrompt(input: str, history: List[str]) -> PromptTemplate:
+    """Return the invoke prompt template for user input and history.
+
+    Args:
+        input: Current user input/question (substituted by the caller)
+        history: List of previous conversation messages (substituted by
+            the caller)
+
+    Returns:
+        PromptTemplate: Invoke prompt template
+    """
+    return _INVOKE_TEMPLATE
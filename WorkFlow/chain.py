@@ -1,57 +1,258 @@
 """LangChain chain for chat with structured output."""
 
-import json
+import asyncio
+import functools
+import hashlib
+import os
 import re
-import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.runnables import Runnable, RunnableSequence
+from langchain_core.runnables import Runnable
 
-# Load environment variables
-load_dotenv()
+# Decode with orjson when available (a C parser, several times faster on
+# the JSON responses the LLM usually returns), falling back to the
+# stdlib in stripped-down environments. Both raise ValueError subclasses
+# on bad input, so callers catch ValueError either way.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    import json
 
-# Add parent directory to path when running directly
-if __name__ == "__main__":
-    backend_dir = Path(__file__).parent.parent
-    if str(backend_dir) not in sys.path:
-        sys.path.insert(0, str(backend_dir))
+    _loads = json.loads
 
-# Handle imports for both package and direct execution
+# Load environment variables
+# Skip .env parsing when the environment already carries the config
+# (ENV_FILE_DISABLED=1 skips it unconditionally)
+if (
+    os.getenv("ENV_FILE_DISABLED") != "1"
+    and not os.getenv("GROQ_API_KEY")
+    and Path(".env").exists()
+):
+    load_dotenv()
+
+# Put the Backend directory on sys.path (works for package and direct use)
 try:
-    from utils.llm import Llm
-    from utils.logger import get_logger
-    from WorkFlow.ChatModel import ChatResponseModel
-    from WorkFlow.Prompts.PromptLibrary import InvokePrompt, SystemPrompt
+    from utils import import_compat  # noqa: F401
 except ImportError:
-    # Fallback to relative imports when used as a package
-    try:
-        from ..utils.llm import Llm
-        from ..utils.logger import get_logger
-        from .ChatModel import ChatResponseModel
-        from .Prompts.PromptLibrary import InvokePrompt, SystemPrompt
-    except ImportError:
-        # Last resort: add parent to path and try again
-        backend_dir = Path(__file__).parent.parent
-        if str(backend_dir) not in sys.path:
-            sys.path.insert(0, str(backend_dir))
-        from utils.llm import Llm
-        from utils.logger import get_logger
-        from WorkFlow.ChatModel import ChatResponseModel
-        from WorkFlow.Prompts.PromptLibrary import InvokePrompt, SystemPrompt
+    from ..utils import import_compat  # noqa: F401
+
+from utils.llm import Llm
+from utils.logger import get_logger
+from WorkFlow.ChatModel import ChatResponseModel
+from WorkFlow.Prompts.PromptLibrary import InvokePrompt, SystemPrompt
 
 logger = get_logger()
 
+# Response-parsing patterns, compiled once at import instead of per LLM
+# response (inline re.search pays a cache lookup and, on eviction, a full
+# recompile for these long patterns)
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_TRAILING_STAR_RE = re.compile(r"\*+$", re.MULTILINE)
+
+# Markdown-format markers, matched case-insensitively by searching a
+# lowered copy of the response with literal str.find
+_EXPLANATION_MARKER = "**explanation:**"
+_CODE_MARKER = "**code:**"
+
+# One parser per process: it depends only on the ChatResponseModel schema
+# (building one also renders the format-instructions JSON schema string)
+_CHAT_PARSER = PydanticOutputParser(pydantic_object=ChatResponseModel)
+
+
+# Formatted system prompts keyed by a digest of the resume text: the
+# resume is stable across a user's session, so the big template
+# substitution runs once per resume instead of per turn. Digest keys
+# bound memory; the whole cache is dropped on resume upload.
+_SYS_PROMPT_CACHE: Dict[bytes, str] = {}
+_SYS_PROMPT_CACHE_MAX = 64
+
+
+def _formatted_system_prompt(resume: str) -> str:
+    """Return the formatted system prompt for a resume, cached by digest."""
+    key = hashlib.blake2b(resume.encode(), digest_size=16).digest()
+    cached = _SYS_PROMPT_CACHE.get(key)
+    if cached is None:
+        cached = SystemPrompt(resume).format(ResumeDetails=resume)
+        if len(_SYS_PROMPT_CACHE) >= _SYS_PROMPT_CACHE_MAX:
+            _SYS_PROMPT_CACHE.clear()
+        _SYS_PROMPT_CACHE[key] = cached
+    return cached
+
+
+def clear_system_prompt_cache() -> None:
+    """Drop cached system prompts (called after a resume upload)."""
+    _SYS_PROMPT_CACHE.clear()
+
+
+@dataclass
+class HistoryBuffer:
+    """Conversation history with an incrementally maintained joined form.
+
+    Rejoining the whole history costs O(total chars) per turn; callers
+    that keep a buffer alive across turns append new lines and the
+    cached string grows by one concatenation instead.
+    """
+
+    lines: List[str] = field(default_factory=list)
+    cached: str = ""
+
+    def append(self, line: str) -> None:
+        """Add a line, extending the cached joined form in place."""
+        self.lines.append(line)
+        self.cached = f"{self.cached}\n{line}" if self.cached else line
+
+    def __bool__(self) -> bool:
+        return bool(self.lines)
+
+
+def _fast_build(d: Dict[str, Any]) -> ChatResponseModel:
+    """Build a ChatResponseModel from decoded JSON, skipping validation.
+
+    The schema is two string fields; when both values are already str,
+    model_construct bypasses Pydantic's per-field validator dispatch.
+    Anything else routes through full validation.
+    """
+    explanation = d.get("explanation", "")
+    code = d.get("code", "")
+    if isinstance(explanation, str) and isinstance(code, str):
+        return ChatResponseModel.model_construct(explanation=explanation, code=code)
+    return ChatResponseModel(**d)
+
+
+def _extract_fenced_json(s: str) -> Optional[str]:
+    """Pull the payload out of a ```json fence with plain string ops.
+
+    partition is a linear C-level scan; the DOTALL regex it replaces
+    backtracks over multi-KB responses. Returns None when there is no
+    closing fence so the caller can fall back to the regex safety net.
+    """
+    _, sep, rest = s.partition("```")
+    if not sep:
+        return None
+    if rest.startswith("json"):
+        rest = rest[4:]
+    body, sep, _ = rest.partition("```")
+    if not sep:
+        return None
+    return body.strip()
+
+
+def _try_json(response_clean: str) -> Optional[ChatResponseModel]:
+    """Parse a pure-JSON response; None when it isn't one or fails to decode."""
+    if not (response_clean.startswith("{") and response_clean.endswith("}")):
+        return None
+    try:
+        parsed_data = _loads(response_clean)
+    except ValueError:
+        logger.debug("Response looks like JSON but failed to parse, falling back")
+        return None
+    logger.debug("Successfully parsed JSON response")
+    return _fast_build(parsed_data)
+
+
+def _try_fenced_json(response_clean: str) -> Optional[ChatResponseModel]:
+    """Parse JSON inside a markdown code fence; None when absent or invalid."""
+    if "```" not in response_clean:
+        return None
+    # Literal partition first, regex only as a safety net for nested fences
+    fenced = _extract_fenced_json(response_clean)
+    if fenced is None or not fenced.startswith("{"):
+        json_match = _JSON_FENCE_RE.search(response_clean)
+        fenced = json_match.group(1) if json_match else None
+    if not fenced:
+        return None
+    try:
+        parsed_data = _loads(fenced)
+    except ValueError:
+        logger.debug("Failed to parse JSON from code block")
+        return None
+    logger.debug("Successfully parsed JSON from code block")
+    return _fast_build(parsed_data)
+
+
+def _try_markdown(
+    response_clean: str, lower_clean: str
+) -> Optional[ChatResponseModel]:
+    """Parse the **explanation:**/**code:** markdown format; None when absent.
+
+    The markers are located once on a lowered copy with literal finds
+    and the original text is sliced by index — the IGNORECASE regexes
+    this replaces each rescanned the whole response.
+    """
+    exp_start = lower_clean.find(_EXPLANATION_MARKER)
+    code_start = lower_clean.find(_CODE_MARKER)
+    if exp_start == -1 and code_start == -1:
+        return None
+
+    explanation = ""
+    code = ""
+
+    # Explanation: text after **explanation:** until **code:** or end
+    if exp_start != -1:
+        end = code_start if code_start > exp_start else len(response_clean)
+        explanation = response_clean[exp_start + len(_EXPLANATION_MARKER) : end].strip()
+        # Remove any trailing markdown artifacts or asterisks
+        explanation = _TRAILING_STAR_RE.sub("", explanation).strip()
+
+    # Code: prefer a ```fenced block``` after **code:**, dropping an
+    # optional language tag on the opening fence line
+    if code_start != -1:
+        code_section = response_clean[code_start + len(_CODE_MARKER) :]
+        _, sep, rest = code_section.partition("```")
+        if sep:
+            body, sep, _ = rest.partition("```")
+            if sep:
+                head, nl, remainder = body.partition("\n")
+                if nl and head.strip().isalnum():
+                    body = remainder
+                code = body.strip()
+        if not code:
+            # No code block: take the text up to a blank line, a
+            # markdown bullet, or the end of the response
+            snippet = code_section
+            for stop in ("\n\n", "\n*"):
+                idx = snippet.find(stop)
+                if idx != -1:
+                    snippet = snippet[:idx]
+            code = snippet.strip()
+
+    # Only an extracted explanation counts as a successful parse
+    if not explanation:
+        return None
+    logger.debug("Successfully parsed markdown format with explanation and code markers")
+    return ChatResponseModel(explanation=explanation, code=code if code else "")
+
+
+def _try_pydantic(response_text: str) -> Optional[ChatResponseModel]:
+    """Last structured attempt via PydanticOutputParser; None on failure."""
+    try:
+        parsed = _CHAT_PARSER.parse(response_text)
+    except Exception as parse_error:
+        logger.debug("Pydantic parser failed: %s", parse_error)
+        return None
+    logger.debug("Successfully parsed using PydanticOutputParser")
+    return parsed
+
 
 class LlmRunnable(Runnable):
-    """Custom Runnable that wraps the Llm function from utils.llm for LangChain compatibility."""
+    """Custom Runnable that wraps the Llm function from utils.llm for LangChain compatibility.
+
+    The runnable only holds the model configuration; the per-turn values
+    (resume details, user input, history) arrive in the invoke payload,
+    so one instance can be cached and shared across requests.
+    """
+
+    # Shared module-level parser; per-instance copies are pure overhead
+    parser = _CHAT_PARSER
 
     def __init__(
         self,
-        system_prompt_text: str,
-        user_prompt_text: str,
         model: str,
         temperature: float,
         top_p: float,
@@ -59,39 +260,57 @@ class LlmRunnable(Runnable):
         """Initialize the LlmRunnable.
 
         Args:
-            system_prompt_text: System prompt text
-            user_prompt_text: User prompt text (includes input and history)
             model: Model name
             temperature: Sampling temperature
             top_p: Nucleus sampling parameter
         """
-        self.system_prompt_text = system_prompt_text
-        self.user_prompt_text = user_prompt_text
         self.model = model
         self.temperature = temperature
         self.top_p = top_p
-        self.parser = PydanticOutputParser(pydantic_object=ChatResponseModel)
 
     def invoke(
         self, input: Dict[str, Any], config: Optional[Any] = None
+    ) -> ChatResponseModel:
+        """Sync shim over ainvoke for callers outside an event loop."""
+        return asyncio.run(self.ainvoke(input, config))
+
+    async def ainvoke(
+        self, input: Dict[str, Any], config: Optional[Any] = None
     ) -> ChatResponseModel:
         """Invoke the LLM and parse structured output.
 
         Args:
-            input: Input dictionary (may contain additional context, but we use pre-formatted prompts)
+            input: Input dictionary with "ResumeDetails", "input" and
+                "history" keys (history is a list of prior messages)
             config: Optional configuration
 
         Returns:
             ChatResponseModel: Parsed structured output
         """
-        logger.debug(f"Invoking LLM with model: {self.model}")
+        logger.debug("Invoking LLM with model: %s", self.model)
+
+        # Format the prompts from the invoke payload
+        resume_details = input.get("ResumeDetails", "") or ""
+        user_input = input.get("input", "") or ""
+        history = input.get("history") or []
+        if isinstance(history, HistoryBuffer):
+            history_str = history.cached or "No previous conversation."
+        else:
+            history_str = (
+                "\n".join(history) if history else "No previous conversation."
+            )
+
+        system_prompt_text = _formatted_system_prompt(resume_details)
+        user_prompt_text = InvokePrompt(user_input, history).format(
+            input=user_input, history=history_str
+        )
 
         # Combine system and user prompts for the Llm function
         # The Llm function expects a system prompt, so we combine both
-        combined_prompt = f"{self.system_prompt_text}\n\n{self.user_prompt_text}"
+        combined_prompt = f"{system_prompt_text}\n\n{user_prompt_text}"
 
         # Call the Llm function (non-streaming for structured output)
-        completion = Llm(
+        completion = await Llm(
             system_prompt=combined_prompt,
             model=self.model,
             temperature=self.temperature,
@@ -114,169 +333,52 @@ class LlmRunnable(Runnable):
                 explanation="No response received from the LLM.", code=""
             )
 
-        logger.debug(f"LLM response received, length: {len(response_text)} characters")
-
-        # Try to parse as structured output
-        try:
-            # First, try to parse as JSON if the response looks like JSON
-            response_clean = response_text.strip()
-            if response_clean.startswith("{") and response_clean.endswith("}"):
-                try:
-                    parsed_data = json.loads(response_clean)
-                    logger.debug("Successfully parsed JSON response")
-                    return ChatResponseModel(**parsed_data)
-                except json.JSONDecodeError:
-                    logger.debug(
-                        "Response looks like JSON but failed to parse, trying other methods"
-                    )
-
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in response_clean or "```" in response_clean:
-                json_match = re.search(
-                    r"```(?:json)?\s*(\{.*?\})\s*```", response_clean, re.DOTALL
-                )
-                if json_match:
-                    try:
-                        parsed_data = json.loads(json_match.group(1))
-                        logger.debug("Successfully parsed JSON from code block")
-                        return ChatResponseModel(**parsed_data)
-                    except json.JSONDecodeError:
-                        logger.debug("Failed to parse JSON from code block")
-
-            # Try to parse markdown format with **explanation:** and **code:** markers
-            if "**explanation:" in response_clean.lower() or "**code:" in response_clean.lower():
-                try:
-                    explanation = ""
-                    code = ""
-                    
-                    # Extract explanation (text after **explanation:** until **code:** or end of string)
-                    explanation_pattern = r"\*\*explanation:\*\*\s*(.*?)(?=\*\*code:\*\*|\*\*Code:\*\*|$)"
-                    explanation_match = re.search(explanation_pattern, response_clean, re.DOTALL | re.IGNORECASE)
-                    if explanation_match:
-                        explanation = explanation_match.group(1).strip()
-                        # Remove any trailing markdown artifacts or asterisks
-                        explanation = re.sub(r"\*+$", "", explanation, flags=re.MULTILINE).strip()
-                    
-                    # Extract code block after **code:** marker
-                    # Look for code block (```language ... ```) after **code:**
-                    code_block_pattern = r"\*\*code:\*\*\s*(?:.*?)?```(?:\w+)?\s*(.*?)```"
-                    code_block_match = re.search(code_block_pattern, response_clean, re.DOTALL | re.IGNORECASE)
-                    if code_block_match:
-                        code = code_block_match.group(1).strip()
-                    else:
-                        # Try to get any text after **code:** if no code block
-                        code_text_pattern = r"\*\*code:\*\*\s*(.*?)(?=\n\n|\n\*|$)"
-                        code_text_match = re.search(code_text_pattern, response_clean, re.DOTALL | re.IGNORECASE)
-                        if code_text_match:
-                            code = code_text_match.group(1).strip()
-                    
-                    # If we successfully extracted an explanation, use it
-                    if explanation:
-                        logger.debug("Successfully parsed markdown format with explanation and code markers")
-                        return ChatResponseModel(explanation=explanation, code=code if code else "")
-                except Exception as markdown_error:
-                    logger.debug(f"Failed to parse markdown format: {markdown_error}")
-
-            # Try using the Pydantic parser (it may extract structured data from text)
-            try:
-                parsed = self.parser.parse(response_text)
-                logger.debug("Successfully parsed using PydanticOutputParser")
-                return parsed
-            except Exception as parse_error:
-                logger.debug(f"Pydantic parser failed: {parse_error}")
-
-            # Fallback: create a response with the raw text as explanation
-            logger.info(
-                "Using fallback: creating response with raw text as explanation"
-            )
-            return ChatResponseModel(explanation=response_text, code="")
-        except Exception as e:
-            logger.warning(
-                f"Failed to parse structured output: {e}. Creating fallback response.",
-                exc_info=True,
-            )
-            # Fallback: create a response with the raw text as explanation
-            return ChatResponseModel(explanation=response_text, code="")
+        logger.debug("LLM response received, length: %d characters", len(response_text))
+
+        # Each _try_* helper gates on the response's shape and returns
+        # None on a miss, so the or-chain still runs at most one full
+        # parse per response. Every helper contains its own parse
+        # failures, which retires the old catch-all try/except around
+        # the whole dispatch
+        response_clean = response_text.strip()
+        result = (
+            _try_json(response_clean)
+            or _try_fenced_json(response_clean)
+            or _try_markdown(response_clean, response_clean.lower())
+            or _try_pydantic(response_text)
+        )
+        if result is not None:
+            return result
+
+        # Fallback: create a response with the raw text as explanation
+        logger.info("Using fallback: creating response with raw text as explanation")
+        return ChatResponseModel(explanation=response_text, code="")
 
 
+@functools.lru_cache(maxsize=32)
 def GetChain(
-    ResumeDetails: str,
-    input: str,
-    history: Optional[List[str]] = None,
     model: str = "openai/gpt-oss-120b",
     temperature: float = 0.6,
     top_p: float = 0.95,
-) -> RunnableSequence:
-    """Create and return a LangChain chain with structured output using Llm from utils.llm.
+) -> LlmRunnable:
+    """Return the chain (cached per configuration) for structured chat output.
+
+    The chain depends only on the model configuration; resume details,
+    user input and history are supplied in the invoke payload. Caching on
+    (model, temperature, top_p) amortizes runnable and parser setup to
+    once per configuration instead of once per request.
 
     Args:
-        ResumeDetails: Resume details string to use in system prompt
-        input: Current user input/question
-        history: Optional list of previous conversation messages
         model: Model name to use (default: "openai/gpt-oss-120b")
         temperature: Sampling temperature (default: 0.6)
         top_p: Nucleus sampling parameter (default: 0.95)
 
     Returns:
-        RunnableSequence: LangChain chain that processes input and returns structured output
+        LlmRunnable: Runnable that takes {"ResumeDetails", "input",
+        "history"} and returns structured output
 
     Raises:
         ValueError: If GROQ_API_KEY is not set
     """
-    logger.info(f"Creating chain with model: {model} using Llm from utils.llm")
-
-    # Create system prompt template
-    logger.debug("Creating system prompt template")
-    sys_prompt_template = SystemPrompt(ResumeDetails)
-
-    # Create invoke prompt template
-    logger.debug("Creating invoke prompt template")
-    history_list = history if history is not None else []
-    invoke_prompt_template = InvokePrompt(input, history_list)
-
-    # Build the chain: system prompt -> invoke prompt -> Llm (from utils.llm)
-    logger.info(
-        "Building chain: system_prompt -> invoke_prompt -> Llm (structured output)"
-    )
-
-    # Format history as a string for the prompt
-    history_str = (
-        "\n".join(history_list) if history_list else "No previous conversation."
-    )
-
-    # Format both prompts with their variables
-    system_prompt_text = sys_prompt_template.format(ResumeDetails=ResumeDetails)
-    user_prompt_text = invoke_prompt_template.format(input=input, history=history_str)
-
-    # Create a custom Runnable that wraps the Llm function from utils.llm
-    logger.debug("Creating LlmRunnable wrapper using Llm from utils.llm")
-    llm_runnable = LlmRunnable(
-        system_prompt_text=system_prompt_text,
-        user_prompt_text=user_prompt_text,
-        model=model,
-        temperature=temperature,
-        top_p=top_p,
-    )
-
-    # Create a simple prompt template that just passes through
-    # The LlmRunnable already has all the prompts, so we just need a passthrough
-    from langchain_core.prompts import ChatPromptTemplate
-
-    # Create a minimal prompt template (the actual prompts are in LlmRunnable)
-    prompt_template = ChatPromptTemplate.from_messages(
-        [
-            ("human", "{input}"),
-        ]
-    )
-
-    # Build the chain: prompt_template -> llm_runnable
-    # The llm_runnable uses Llm from utils.llm internally
-    chain = prompt_template | llm_runnable
-
-    logger.debug(
-        "Chain structure: ChatPromptTemplate -> LlmRunnable (using utils.llm.Llm)"
-    )
-
-    logger.info("Chain created successfully using Llm from utils.llm")
-
-    return chain
+    logger.info("Creating chain with model: %s using Llm from utils.llm", model)
+    return LlmRunnable(model=model, temperature=temperature, top_p=top_p)
@@ -1,8 +1,9 @@
 import sys
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Add Backend directory to path for imports
 backend_dir = Path(__file__).parent
@@ -10,18 +11,11 @@ if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
 # Import routers (after path modification, so we suppress E402)
-from Controller.AuthController.deleteUserController import \
-    router as delete_user_router  # noqa: E402
-from Controller.AuthController.GetUserController import \
-    router as get_user_router  # noqa: E402
-from Controller.AuthController.SingUpController import \
-    router as signup_router  # noqa: E402
-from Controller.ChatControllers.GetResumeDetailsController import \
-    router as get_resume_details_router  # noqa: E402
-from Controller.ChatControllers.InvokeChatController import \
-    router as invoke_chat_router  # noqa: E402
-from Controller.ChatControllers.ResumeUploadController import \
-    router as resume_upload_router  # noqa: E402
+# Importing the packages registers every endpoint on the shared routers
+from Controller.AuthController import auth_router  # noqa: E402
+from Controller.ChatControllers import chat_router  # noqa: E402
+from Database.core import verify_database_connection  # noqa: E402
+from utils.exceptions import BaseAppException  # noqa: E402
 from utils.logger import get_logger  # noqa: E402
 
 logger = get_logger()
@@ -31,6 +25,7 @@ app = FastAPI(
     title="ProxyTool API",
     description="Backend API for ProxyTool application",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -42,13 +37,71 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Register routers
-app.include_router(signup_router)
-app.include_router(delete_user_router)
-app.include_router(get_user_router)
-app.include_router(resume_upload_router)
-app.include_router(get_resume_details_router)
-app.include_router(invoke_chat_router)
+# Static payload for the generic 500 handler, built once at import
+_INTERNAL_ERROR_DETAIL = {
+    "detail": {
+        "error": "InternalServerError",
+        "message": "An unexpected error occurred while processing the request.",
+    }
+}
+
+
+# Centralized exception translation: controllers raise application
+# exceptions and these handlers convert them to HTTP responses once,
+# instead of every endpoint repeating the same except blocks
+@app.exception_handler(BaseAppException)
+async def app_exception_handler(request: Request, exc: BaseAppException):
+    """Translate application exceptions into their mapped HTTP responses."""
+    logger.warning(
+        "Application exception on %s: %s", request.url.path, exc.message
+    )
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={
+            "detail": {
+                "error": exc.__class__.__name__,
+                "message": exc.message,
+            }
+        },
+    )
+
+
+@app.exception_handler(ValueError)
+async def value_error_handler(request: Request, exc: ValueError):
+    """Translate service-level validation errors into 400 responses."""
+    logger.warning("Validation error on %s: %s", request.url.path, str(exc))
+    return ORJSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={
+            "detail": {
+                "error": "ValidationError",
+                "message": str(exc),
+            }
+        },
+    )
+
+
+@app.exception_handler(Exception)
+async def unexpected_exception_handler(request: Request, exc: Exception):
+    """Catch-all for unexpected errors, logged with the full traceback."""
+    logger.error(
+        "Unexpected error on %s: %s", request.url.path, str(exc), exc_info=True
+    )
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content=_INTERNAL_ERROR_DETAIL,
+    )
+
+
+@app.on_event("startup")
+async def on_startup():
+    """Probe the database and create tables once the event loop is running."""
+    await verify_database_connection()
+
+
+# Register routers (one per URL namespace)
+app.include_router(auth_router)
+app.include_router(chat_router)
 
 logger.info("FastAPI application initialized successfully")
 
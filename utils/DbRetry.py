@@ -0,0 +1,59 @@
+"""Retry helper for queries that hit a stale pooled connection.
+
+With ``pool_pre_ping`` disabled (see ``Database/core.py``) a connection
+that went stale inside its recycle window surfaces as a ``DBAPIError``
+with ``connection_invalidated=True`` on first use. SQLAlchemy has already
+dropped the dead connection at that point, so one rollback-and-retry on a
+fresh connection is all the recovery needed.
+"""
+
+import functools
+
+from sqlalchemy.exc import DBAPIError
+
+# Put the Backend directory on sys.path (works for package and direct use)
+try:
+    from utils import import_compat  # noqa: F401
+except ImportError:
+    from ..utils import import_compat  # noqa: F401
+
+from utils.exceptions import DatabaseOperationException
+from utils.logger import get_logger
+
+logger = get_logger()
+
+
+def _is_disconnect(exc: BaseException) -> bool:
+    """Return True when the error means the pooled connection went stale.
+
+    Services wrap driver errors in DatabaseOperationException, so the
+    invalidated DBAPIError may sit one level down as ``__cause__``.
+    """
+    if isinstance(exc, DBAPIError):
+        return exc.connection_invalidated
+    if isinstance(exc, DatabaseOperationException):
+        cause = exc.__cause__
+        return isinstance(cause, DBAPIError) and cause.connection_invalidated
+    return False
+
+
+def retry_on_disconnect(func):
+    """Retry an async service once when its connection was invalidated.
+
+    The wrapped coroutine must take the session as its first argument.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(db, *args, **kwargs):
+        try:
+            return await func(db, *args, **kwargs)
+        except Exception as exc:
+            if not _is_disconnect(exc):
+                raise
+            logger.warning(
+                "Stale connection detected in %s, retrying once", func.__name__
+            )
+            await db.rollback()
+            return await func(db, *args, **kwargs)
+
+    return wrapper
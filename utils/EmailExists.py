@@ -1,30 +1,48 @@
-# Handle imports for both package and direct execution
+# Put the Backend directory on sys.path (works for package and direct use)
 try:
-    from Database.core import Session
-    from Schema.User import User
-    from utils.logger import get_logger
+    from utils import import_compat  # noqa: F401
 except ImportError:
-    # Fallback to relative imports when used as a package
-    from ..Database.core import Session
-    from ..Schema.User import User
-    from ..utils.logger import get_logger
+    from ..utils import import_compat  # noqa: F401
+
+from cachetools import TTLCache
+from sqlalchemy import text
+
+from Database.core import AsyncSession
+from utils.logger import get_logger
 
 logger = get_logger()
 
+# Positive answers only: an existing email stays existing (short of a
+# delete, which is rare), so repeated signup probes for the same address
+# skip the round-trip. Negative answers are never cached — a signup must
+# see its own insert immediately.
+_exists_cache = TTLCache(maxsize=4096, ttl=60)
+
+# Static statement, compiled once: EXISTS lets Postgres stop at the first
+# matching index entry and ships back a single boolean — no ORM row is
+# materialized
+_EMAIL_EXISTS_SQL = text("SELECT EXISTS(SELECT 1 FROM users WHERE email = :e)")
 
-def check_email_exists(db: Session, email: str) -> bool:
+
+async def check_email_exists(db: AsyncSession, email: str) -> bool:
     """Check if email already exists in the database.
 
     Args:
         db: Database session
-        email: Email to check
+        email: Email to check (already lowercased at the API boundary)
 
     Returns:
         bool: True if email exists, False otherwise
     """
+    if _exists_cache.get(email):
+        return True
+
     try:
-        existing_user = db.query(User).filter(User.email == email.lower()).first()
-        return existing_user is not None
+        result = await db.execute(_EMAIL_EXISTS_SQL, {"e": email})
+        exists = bool(result.scalar())
+        if exists:
+            _exists_cache[email] = True
+        return exists
     except Exception as e:
         logger.error(f"Error checking email existence: {str(e)}", exc_info=True)
         raise
@@ -0,0 +1,92 @@
+"""Optional Redis lookaside cache for hot read endpoints.
+
+The cache is keyed by email and stores already-serialized response bodies,
+so a hit skips the database round-trip and the JSON serialization entirely.
+When REDIS_URL is not configured (or Redis is unreachable) every helper
+degrades to a no-op, so the endpoints keep working without a cache.
+"""
+
+import os
+from typing import Optional
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    # Redis is optional - caching is simply disabled when it is missing
+    aioredis = None
+
+# Put the Backend directory on sys.path (works for package and direct use)
+try:
+    from utils import import_compat  # noqa: F401
+except ImportError:
+    from ..utils import import_compat  # noqa: F401
+
+from utils.logger import get_logger
+
+logger = get_logger()
+
+# Default TTL for cached responses (seconds)
+DEFAULT_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "300"))
+
+_client = None
+_client_initialized = False
+
+
+def _get_client():
+    """Lazily create the shared Redis client (or None when caching is disabled)."""
+    global _client, _client_initialized
+
+    if _client_initialized:
+        return _client
+
+    _client_initialized = True
+    redis_url = os.getenv("REDIS_URL")
+
+    if not redis_url:
+        logger.info("REDIS_URL not set - response caching disabled")
+        return None
+
+    if aioredis is None:
+        logger.warning("redis package not installed - response caching disabled")
+        return None
+
+    logger.info("Initializing Redis client for response caching")
+    _client = aioredis.from_url(redis_url)
+    return _client
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Fetch a cached response body, returning None on miss or Redis failure."""
+    client = _get_client()
+    if client is None:
+        return None
+
+    try:
+        return await client.get(key)
+    except Exception as e:
+        logger.warning(f"Redis GET failed for key {key}: {str(e)}")
+        return None
+
+
+async def cache_set(key: str, value: bytes, ttl: int = DEFAULT_TTL) -> None:
+    """Store a serialized response body with a TTL, ignoring Redis failures."""
+    client = _get_client()
+    if client is None:
+        return
+
+    try:
+        await client.setex(key, ttl, value)
+    except Exception as e:
+        logger.warning(f"Redis SETEX failed for key {key}: {str(e)}")
+
+
+async def cache_delete(*keys: str) -> None:
+    """Invalidate cached entries after a mutation, ignoring Redis failures."""
+    client = _get_client()
+    if client is None or not keys:
+        return
+
+    try:
+        await client.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Redis DEL failed for keys {keys}: {str(e)}")
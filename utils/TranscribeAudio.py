@@ -1,18 +1,22 @@
+import asyncio
 import os
-import sys
+import random
+import threading
 from pathlib import Path
+from typing import Any, BinaryIO, Optional, Union
 
 from dotenv import load_dotenv
-from groq import Groq
+from groq import AsyncGroq
 
 # Load environment variables
-load_dotenv()
-
-# Add parent directory to path when running directly
-if __name__ == "__main__":
-    backend_dir = Path(__file__).parent.parent
-    if str(backend_dir) not in sys.path:
-        sys.path.insert(0, str(backend_dir))
+# Skip .env parsing when the environment already carries the config
+# (ENV_FILE_DISABLED=1 skips it unconditionally)
+if (
+    os.getenv("ENV_FILE_DISABLED") != "1"
+    and not os.getenv("GROQ_API_KEY")
+    and Path(".env").exists()
+):
+    load_dotenv()
 
 try:
     from groq import GroqError
@@ -20,122 +24,194 @@ except ImportError:
     # Fallback if GroqError doesn't exist
     GroqError = Exception
 
-# Handle imports for both package and direct execution
 try:
-    from utils.exceptions import BaseAppException
-    from utils.logger import get_logger
+    from groq import APITimeoutError, RateLimitError
+
+    _RETRIABLE_ERRORS = (APITimeoutError, RateLimitError)
 except ImportError:
-    # Fallback to relative imports when used as a package
-    try:
-        from ..utils.exceptions import BaseAppException
-        from ..utils.logger import get_logger
-    except ImportError:
-        # Last resort: add parent to path and try again
-        backend_dir = Path(__file__).parent.parent
-        if str(backend_dir) not in sys.path:
-            sys.path.insert(0, str(backend_dir))
-        from utils.exceptions import BaseAppException
-        from utils.logger import get_logger
+    # Older SDKs without the split error classes: no retry classification
+    _RETRIABLE_ERRORS = ()
+
+# Put the Backend directory on sys.path (works for package and direct use)
+try:
+    from utils import import_compat  # noqa: F401
+except ImportError:
+    from ..utils import import_compat  # noqa: F401
+
+from utils.exceptions import BaseAppException
+from utils.logger import get_logger
 
 logger = get_logger()
 
 
+# Resolved once at import: the in-exception `from fastapi import status`
+# paid an import-system lookup on every raise. Prefer the renamed
+# constant on newer FastAPI, fall back to the old name, then to the bare
+# code when fastapi is absent (direct script use).
+try:
+    from fastapi import status as _status
+
+    _STATUS_CODE_422 = getattr(
+        _status,
+        "HTTP_422_UNPROCESSABLE_CONTENT",
+        _status.HTTP_422_UNPROCESSABLE_ENTITY,
+    )
+except ImportError:
+    _STATUS_CODE_422 = 422
+
+
 class AudioTranscriptionException(BaseAppException):
     """Raised when audio transcription fails."""
 
     def __init__(self, message: str, details: str = None):
-        try:
-            from fastapi import status
-
-            # Use the new constant if available, fallback to old one
-            status_code = getattr(
-                status,
-                "HTTP_422_UNPROCESSABLE_CONTENT",
-                status.HTTP_422_UNPROCESSABLE_ENTITY,
-            )
-        except ImportError:
-            # If fastapi is not available, use default
-            status_code = 422
-
-        super().__init__(message, status_code=status_code)
+        super().__init__(message, status_code=_STATUS_CODE_422)
         self.details = details
 
 
-def TranscribeAudio(audio_path: str) -> str:
-    """Transcribe audio file to text using Groq Whisper model.
+# One Groq client per process — same pattern as utils/llm.py — so the
+# HTTPX client, TLS context and connection pool are built once and the
+# keep-alive connections get reused across transcriptions
+_CLIENT: Any = None
+_CLIENT_LOCK = threading.Lock()
 
-    Args:
-        audio_path: Path to the audio file
+# Bounded retries on rate limits and timeouts — same policy as utils/llm.py
+_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
 
-    Returns:
-        str: Transcribed text from the audio file
+
+def _get_client() -> AsyncGroq:
+    """Return the shared async Groq client, building it on first use.
 
     Raises:
-        AudioTranscriptionException: If transcription fails
-        FileNotFoundError: If audio file does not exist
+        AudioTranscriptionException: If GROQ_API_KEY is not set
     """
-    logger.info(f"Starting audio transcription for file: {audio_path}")
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                api_key = os.getenv("GROQ_API_KEY")
+                if not api_key:
+                    logger.error("GROQ_API_KEY environment variable is not set")
+                    raise AudioTranscriptionException(
+                        "GROQ_API_KEY environment variable is not set. "
+                        "Please set it in your .env file or environment variables."
+                    )
+                logger.debug("Initializing shared Groq client")
+                _CLIENT = AsyncGroq(api_key=api_key)
+    return _CLIENT
+
+
+async def TranscribeAudio(
+    audio: Union[str, BinaryIO], filename: Optional[str] = None
+) -> str:
+    """Transcribe audio to text using Groq Whisper model.
+
+    Async: the upload suspends on the event loop rather than occupying a
+    worker thread for the duration of the request.
+
+    Accepts either a path on disk or an in-memory file-like object, so
+    callers that already hold the upload in a buffer can skip the
+    temp-file write/re-open/unlink round-trip entirely.
 
-    # Validate file path
-    audio_file = Path(audio_path)
-    if not audio_file.exists():
-        logger.error(f"Audio file not found: {audio_path}")
-        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    Args:
+        audio: Path to the audio file, or a binary file-like object
+        filename: Name hint for buffer input (extension tells the API the
+            container format); defaults to the path or the buffer's name
 
-    if not audio_file.is_file():
-        logger.error(f"Path is not a file: {audio_path}")
-        raise ValueError(f"Path is not a file: {audio_path}")
+    Returns:
+        str: Transcribed text from the audio
 
-    # Check file size
-    file_size = audio_file.stat().st_size
-    logger.debug(f"Audio file size: {file_size} bytes")
+    Raises:
+        AudioTranscriptionException: If transcription fails
+        FileNotFoundError: If an audio path does not exist
+    """
+    # Resolve the input to an open handle: the Groq SDK streams a
+    # file-like body chunk by chunk, so peak memory stays O(chunk)
+    # instead of holding the whole clip in one bytes object
+    if isinstance(audio, str):
+        logger.info("Starting audio transcription for file: %s", audio)
+
+        # Validate file path
+        audio_file = Path(audio)
+        if not audio_file.exists():
+            logger.error("Audio file not found: %s", audio)
+            raise FileNotFoundError(f"Audio file not found: {audio}")
+
+        if not audio_file.is_file():
+            logger.error("Path is not a file: %s", audio)
+            raise ValueError(f"Path is not a file: {audio}")
+
+        file_size = audio_file.stat().st_size
+        name = filename or audio
+        handle: BinaryIO = open(audio, "rb")
+    else:
+        logger.info("Starting audio transcription from in-memory buffer")
+        audio.seek(0, os.SEEK_END)
+        file_size = audio.tell()
+        audio.seek(0)
+        name = filename or getattr(audio, "name", "audio.wav")
+        handle = audio
+
+    logger.debug("Audio payload size: %d bytes", file_size)
 
     if file_size == 0:
-        logger.warning("Audio file is empty")
+        if handle is not audio:
+            handle.close()
+        logger.warning("Audio input is empty")
         raise AudioTranscriptionException("Audio file is empty")
 
     try:
-        # Initialize Groq client
-        logger.debug("Initializing Groq client")
-        # Get API key from environment
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            logger.error("GROQ_API_KEY environment variable is not set")
-            raise AudioTranscriptionException(
-                "GROQ_API_KEY environment variable is not set. "
-                "Please set it in your .env file or environment variables."
-            )
-        client = Groq(api_key=api_key)
-
-        # Read and transcribe audio file
-        logger.debug(f"Reading audio file: {audio_path}")
-        with open(audio_path, "rb") as audio_file_handle:
-            audio_data = audio_file_handle.read()
-            logger.debug(f"Read {len(audio_data)} bytes from audio file")
-
-            logger.info("Transcribing audio with model: whisper-large-v3-turbo")
-            transcription = client.audio.transcriptions.create(
-                file=(audio_path, audio_data),
-                model="whisper-large-v3-turbo",
-            )
-
-            if not transcription or not transcription.text:
-                logger.warning("Transcription returned empty result")
-                raise AudioTranscriptionException("Transcription returned empty result")
-
-            transcribed_text = transcription.text.strip()
-            logger.info(
-                f"Successfully transcribed audio. Text length: {len(transcribed_text)} characters"
-            )
-
-            return transcribed_text
+        # Shared Groq client (built once, keep-alive connections reused)
+        client = _get_client()
+
+        logger.info("Transcribing audio with model: whisper-large-v3-turbo")
+        try:
+            # Retry transient provider errors with exponential backoff
+            # plus jitter; the handle is rewound before each attempt
+            # because the previous one consumed it
+            for attempt in range(_MAX_RETRIES):
+                try:
+                    handle.seek(0)
+                    transcription = await client.audio.transcriptions.create(
+                        file=(name, handle),
+                        model="whisper-large-v3-turbo",
+                    )
+                    break
+                except _RETRIABLE_ERRORS as e:
+                    if attempt == _MAX_RETRIES - 1:
+                        raise
+                    delay = min(2**attempt, 8) + random.random() * 0.25
+                    logger.warning(
+                        "Retriable Groq error (%s); retrying in %.2fs (attempt %d/%d)",
+                        e,
+                        delay,
+                        attempt + 1,
+                        _MAX_RETRIES,
+                    )
+                    await asyncio.sleep(delay)
+        finally:
+            # Only close handles this function opened; callers own theirs
+            if handle is not audio:
+                handle.close()
+
+        if not transcription or not transcription.text:
+            logger.warning("Transcription returned empty result")
+            raise AudioTranscriptionException("Transcription returned empty result")
+
+        transcribed_text = transcription.text.strip()
+        logger.info(
+            "Successfully transcribed audio. Text length: %d characters",
+            len(transcribed_text),
+        )
+
+        return transcribed_text
 
     except FileNotFoundError:
         # Re-raise file not found errors
         raise
     except GroqError as e:
         logger.error(
-            f"Groq API error during transcription: {str(e)}",
+            "Groq API error during transcription: %s",
+            e,
             exc_info=True,
         )
         raise AudioTranscriptionException(
@@ -144,7 +220,8 @@ def TranscribeAudio(audio_path: str) -> str:
         ) from e
     except Exception as e:
         logger.error(
-            f"Unexpected error during audio transcription: {str(e)}",
+            "Unexpected error during audio transcription: %s",
+            e,
             exc_info=True,
         )
         raise AudioTranscriptionException(
@@ -0,0 +1,22 @@
+"""One-time sys.path bootstrap for the Backend modules.
+
+Modules used to carry a per-file try/except import ladder (absolute,
+then relative, then a sys.path hack), paying a caught ImportError per
+module at startup. Importing this module once puts the Backend directory
+on sys.path so plain absolute imports work everywhere, whether the tree
+is imported as a package or run directly.
+"""
+
+import sys
+from pathlib import Path
+
+_BACKEND_DIR = str(Path(__file__).resolve().parent.parent)
+
+
+def ensure_backend_on_path() -> None:
+    """Idempotently put the Backend directory at the front of sys.path."""
+    if _BACKEND_DIR not in sys.path:
+        sys.path.insert(0, _BACKEND_DIR)
+
+
+ensure_backend_on_path()
@@ -1,20 +1,26 @@
+import asyncio
+import functools
+import hashlib
 import os
-import sys
+import random
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
 
 from dotenv import load_dotenv
-from groq import Groq
+from groq import AsyncGroq
 from langchain_core.prompts import PromptTemplate
 
 # Load environment variables
-load_dotenv()
-
-# Add parent directory to path when running directly
-if __name__ == "__main__":
-    backend_dir = Path(__file__).parent.parent
-    if str(backend_dir) not in sys.path:
-        sys.path.insert(0, str(backend_dir))
+# Skip .env parsing when the environment already carries the config
+# (ENV_FILE_DISABLED=1 skips it unconditionally)
+if (
+    os.getenv("ENV_FILE_DISABLED") != "1"
+    and not os.getenv("GROQ_API_KEY")
+    and Path(".env").exists()
+):
+    load_dotenv()
 
 try:
     from groq import GroqError
@@ -22,48 +28,103 @@ except ImportError:
     # Fallback if GroqError doesn't exist
     GroqError = Exception
 
-# Handle imports for both package and direct execution
 try:
-    from utils.exceptions import BaseAppException
-    from utils.logger import get_logger
+    from groq import APITimeoutError, RateLimitError
+
+    _RETRIABLE_ERRORS = (APITimeoutError, RateLimitError)
 except ImportError:
-    # Fallback to relative imports when used as a package
-    try:
-        from ..utils.exceptions import BaseAppException
-        from ..utils.logger import get_logger
-    except ImportError:
-        # Last resort: add parent to path and try again
-        backend_dir = Path(__file__).parent.parent
-        if str(backend_dir) not in sys.path:
-            sys.path.insert(0, str(backend_dir))
-        from utils.exceptions import BaseAppException
-        from utils.logger import get_logger
+    # Older SDKs without the split error classes: no retry classification
+    _RETRIABLE_ERRORS = ()
+
+# Put the Backend directory on sys.path (works for package and direct use)
+try:
+    from utils import import_compat  # noqa: F401
+except ImportError:
+    from ..utils import import_compat  # noqa: F401
+
+from utils.exceptions import BaseAppException
+from utils.logger import get_logger
 
 logger = get_logger()
 
+# Opt-in response cache (LLM_CACHE=1): identical non-streaming requests
+# recur during development, retries and repeated questions, and a hit
+# saves the entire provider round-trip. Keyed on a digest of the full
+# request, bounded LRU, guarded by a lock because Llm runs on pool threads.
+_LLM_CACHE_ENABLED = os.getenv("LLM_CACHE") == "1"
+
+# Bounded retries on rate limits and timeouts: one provider hiccup
+# otherwise burns the whole user request
+_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+_RESPONSE_CACHE: "OrderedDict[str, Any]" = OrderedDict()
+_RESPONSE_CACHE_MAX = int(os.getenv("LLM_CACHE_SIZE", "512"))
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# One Groq client per process: building one spins up an HTTPX client with
+# its TLS context and connection pool, and reusing it keeps provider
+# connections alive across calls
+_CLIENT: Any = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> AsyncGroq:
+    """Return the shared async Groq client, building it on first use.
+
+    Raises:
+        LLMException: If GROQ_API_KEY is not set
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                api_key = os.getenv("GROQ_API_KEY")
+                if not api_key:
+                    logger.error("GROQ_API_KEY environment variable is not set")
+                    raise LLMException(
+                        "GROQ_API_KEY environment variable is not set. "
+                        "Please set it in your .env file or environment variables."
+                    )
+                logger.debug("Initializing shared Groq client")
+                _CLIENT = AsyncGroq(api_key=api_key)
+    return _CLIENT
+
+
+# Resolved once at import: the in-exception `from fastapi import status`
+# paid an import-system lookup on every raise. Prefer the renamed
+# constant on newer FastAPI, fall back to the old name, then to the bare
+# code when fastapi is absent (direct script use).
+try:
+    from fastapi import status as _status
+
+    _STATUS_CODE_422 = getattr(
+        _status,
+        "HTTP_422_UNPROCESSABLE_CONTENT",
+        _status.HTTP_422_UNPROCESSABLE_ENTITY,
+    )
+except ImportError:
+    _STATUS_CODE_422 = 422
+
+
+@functools.lru_cache(maxsize=32)
+def _supports_reasoning(model: str) -> bool:
+    """Whether the model accepts reasoning_format/reasoning_effort.
+
+    Memoized: a deployment uses a handful of model names, so the
+    lowercase-and-scan runs once per name instead of per request.
+    """
+    m = model.lower()
+    return "gpt-oss" in m or "deepseek" in m
+
 
 class LLMException(BaseAppException):
     """Raised when LLM operation fails."""
 
     def __init__(self, message: str, details: str = None):
-        try:
-            from fastapi import status
-
-            # Use the new constant if available, fallback to old one
-            status_code = getattr(
-                status,
-                "HTTP_422_UNPROCESSABLE_CONTENT",
-                status.HTTP_422_UNPROCESSABLE_ENTITY,
-            )
-        except ImportError:
-            # If fastapi is not available, use default
-            status_code = 422
-
-        super().__init__(message, status_code=status_code)
+        super().__init__(message, status_code=_STATUS_CODE_422)
         self.details = details
 
 
-def Llm(
+async def Llm(
     system_prompt: Union[str, PromptTemplate],
     model: str = "openai/gpt-oss-120b",
     temperature: float = 0.6,
@@ -72,6 +133,9 @@ def Llm(
 ):
     """Invoke Groq LLM with a system prompt.
 
+    Async so the HTTP round-trip suspends on the event loop instead of
+    parking a worker thread for the full provider latency.
+
     Args:
         system_prompt: System prompt as string or PromptTemplate object
         model: Model name to use (default: "openai/gpt-oss-120b")
@@ -85,7 +149,7 @@ def Llm(
     Raises:
         LLMException: If LLM operation fails
     """
-    logger.info(f"Starting LLM invocation with model: {model}")
+    logger.info("Starting LLM invocation with model: %s", model)
 
     try:
         # Convert PromptTemplate to string if needed
@@ -100,18 +164,24 @@ def Llm(
         else:
             prompt_text = str(system_prompt)
 
-        logger.debug(f"System prompt length: {len(prompt_text)} characters")
+        logger.debug("System prompt length: %d characters", len(prompt_text))
 
-        # Initialize Groq client
-        logger.debug("Initializing Groq client")
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            logger.error("GROQ_API_KEY environment variable is not set")
-            raise LLMException(
-                "GROQ_API_KEY environment variable is not set. "
-                "Please set it in your .env file or environment variables."
-            )
-        client = Groq(api_key=api_key)
+        # Streams are single-use and never cached
+        cache_key = None
+        if _LLM_CACHE_ENABLED and not stream:
+            cache_key = hashlib.blake2b(
+                f"{model}|{temperature}|{top_p}|{prompt_text}".encode(),
+                digest_size=16,
+            ).hexdigest()
+            with _RESPONSE_CACHE_LOCK:
+                cached = _RESPONSE_CACHE.get(cache_key)
+                if cached is not None:
+                    _RESPONSE_CACHE.move_to_end(cache_key)
+                    logger.info("Serving LLM response from cache")
+                    return cached
+
+        # Shared Groq client (built once, keep-alive connections reused)
+        client = _get_client()
 
         # Prepare messages
         messages = [
@@ -121,7 +191,7 @@ def Llm(
             }
         ]
 
-        logger.info(f"Creating chat completion with {len(messages)} message(s)")
+        logger.info("Creating chat completion with %d message(s)", len(messages))
 
         # Create completion parameters
         completion_params = {
@@ -134,25 +204,54 @@ def Llm(
 
         # Add reasoning parameters only if model supports them
         # These parameters are only valid for certain models
-        if "gpt-oss" in model.lower() or "deepseek" in model.lower():
+        if _supports_reasoning(model):
             completion_params["reasoning_format"] = "hidden"
             completion_params["reasoning_effort"] = "high"
             logger.debug("Added reasoning parameters for model")
 
         logger.debug(
-            f"Completion parameters: model={model}, temperature={temperature}, top_p={top_p}, stream={stream}"
+            "Completion parameters: model=%s, temperature=%s, top_p=%s, stream=%s",
+            model,
+            temperature,
+            top_p,
+            stream,
         )
 
-        # Create completion
-        completion = client.chat.completions.create(**completion_params)
+        # Create completion, retrying transient provider errors with
+        # exponential backoff plus jitter (auth and other 4xx re-raise)
+        for attempt in range(_MAX_RETRIES):
+            try:
+                completion = await client.chat.completions.create(
+                    **completion_params
+                )
+                break
+            except _RETRIABLE_ERRORS as e:
+                if attempt == _MAX_RETRIES - 1:
+                    raise
+                delay = min(2**attempt, 8) + random.random() * 0.25
+                logger.warning(
+                    "Retriable Groq error (%s); retrying in %.2fs (attempt %d/%d)",
+                    e,
+                    delay,
+                    attempt + 1,
+                    _MAX_RETRIES,
+                )
+                await asyncio.sleep(delay)
 
         logger.info("Successfully created chat completion")
 
+        if cache_key is not None:
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[cache_key] = completion
+                if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX:
+                    _RESPONSE_CACHE.popitem(last=False)
+
         return completion
 
     except GroqError as e:
         logger.error(
-            f"Groq API error during LLM invocation: {str(e)}",
+            "Groq API error during LLM invocation: %s",
+            e,
             exc_info=True,
         )
         raise LLMException(
@@ -161,7 +260,8 @@ def Llm(
         ) from e
     except Exception as e:
         logger.error(
-            f"Unexpected error during LLM invocation: {str(e)}",
+            "Unexpected error during LLM invocation: %s",
+            e,
             exc_info=True,
         )
         raise LLMException(
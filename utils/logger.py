@@ -1,9 +1,14 @@
 import inspect
 import logging
+import os
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from threading import Lock
 
+# DEBUG-level tracing costs formatting and I/O per request; default to INFO
+# and let deployments opt into verbosity with LOG_LEVEL=DEBUG
+_LOG_LEVEL = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+
 
 class ColorFormatter(logging.Formatter):
     COLOR = {
@@ -38,7 +43,7 @@ class FileTrackingLogger:
 
         # Base logger for console output
         self.base_logger = logging.getLogger("Get_Your_Clothing")
-        self.base_logger.setLevel(logging.DEBUG)
+        self.base_logger.setLevel(_LOG_LEVEL)
 
         # Console handler (shared across all loggers)
         if not any(
@@ -105,7 +110,7 @@ class FileTrackingLogger:
             # Get or create logger for this module
             if current_module not in self.loggers:
                 logger = logging.getLogger(f"Get_Your_Clothing.{current_module}")
-                logger.setLevel(logging.DEBUG)
+                logger.setLevel(_LOG_LEVEL)
 
                 # Add console handler (if not already added)
                 if not any(